@@ -37,12 +37,16 @@ Created: 2026
 ==============================================================================
 """
 
-import json
 import sys
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 
+import ijson
+import numpy as np
+import orjson
+import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -71,10 +75,15 @@ HIGH_VELOCITY_THRESHOLD = 200   # m/s (~720 km/h, ~390 knots)
 # Output file path (relative to project root)
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "data"
 OUTPUT_FILE = OUTPUT_DIR / "flight_radar.json"
+PARQUET_FILE = OUTPUT_FILE.with_suffix(".parquet")  # Columnar copy of the aircraft
 
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
+# Streamed state vectors are filtered in chunks of this size, so the NumPy
+# pass stays vectorized without materializing the whole response
+STATE_CHUNK_SIZE = 1024
+
 
 # ==============================================================================
 # STATE VECTOR FIELD INDICES
@@ -106,6 +115,33 @@ class StateVectorIndex:
     POSITION_SOURCE = 16  # Origin of position: 0=ADS-B, etc.
 
 
+# Checked while decoding: rows missing a coordinate or shorter than the
+# documented schema are dropped before a list is ever built for them
+POSITION_FIELDS = (StateVectorIndex.LONGITUDE, StateVectorIndex.LATITUDE)
+STATE_VECTOR_MIN_FIELDS = StateVectorIndex.POSITION_SOURCE + 1
+
+
+class Aircraft(NamedTuple):
+    """
+    Parsed aircraft record.
+    
+    A tuple-backed record rather than a dict per aircraft: no per-instance
+    key table, and it is only converted to a dict when serialized.
+    """
+    icao24: str
+    callsign: str
+    origin_country: str
+    longitude: float
+    latitude: float
+    geo_altitude: Optional[float]
+    velocity: Optional[float]
+    on_ground: bool
+    true_track: Optional[float]
+    vertical_rate: Optional[float]
+    tag: Optional[str] = None
+    tag_reason: Optional[str] = None
+
+
 def create_retry_session() -> requests.Session:
     """
     Create a requests session with retry logic for network resilience.
@@ -136,15 +172,80 @@ def create_retry_session() -> requests.Session:
     return session
 
 
+def stream_state_vectors(
+    response: requests.Response,
+    raw_data: Dict[str, Any]
+) -> Iterator[List]:
+    """
+    Incrementally parse an OpenSky response, yielding one state vector at a time.
+    
+    The body is walked with ijson straight off the socket, so the full payload
+    is never materialized as a dict; each state vector is handed to the consumer
+    as soon as its array closes. The top-level 'time' field (emitted by OpenSky
+    ahead of 'states') is recorded into raw_data as a side effect.
+    
+    Rows are validated as they decode: once a coordinate turns out null the
+    rest of the row is skipped, and malformed rows never reach the parser.
+    Both are counted in raw_data['dropped']. A body that is invalid or cut
+    off mid-stream sets raw_data['error'], so the partial snapshot is
+    discarded instead of saved.
+    
+    Args:
+        response: Streaming response from the OpenSky API
+        raw_data: Response dict to record the API timestamp and drops into
+        
+    Yields:
+        Positioned state vector arrays (the nested 'sensors' array is
+        collapsed to None)
+    """
+    # Transparently decompress gzip/deflate bodies
+    response.raw.decode_content = True
+    raw_data["dropped"] = 0
+    state = None
+    
+    try:
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if prefix == "time" and event == "number":
+                raw_data["time"] = int(value)
+            elif prefix == "states.item":
+                if event == "start_array":
+                    state = []
+                elif event == "end_array":
+                    if state is not None and len(state) >= STATE_VECTOR_MIN_FIELDS:
+                        yield state
+                    else:
+                        raw_data["dropped"] += 1
+            elif prefix == "states.item.item" and state is not None:
+                if event == "start_array":
+                    # Sensor ID list - unused downstream, keep index alignment
+                    state.append(None)
+                elif event == "end_array":
+                    pass
+                elif value is None and len(state) in POSITION_FIELDS:
+                    # No position: the row would be filtered out anyway
+                    state = None
+                else:
+                    state.append(value)
+    except ijson.JSONError:
+        print("  ❌ Invalid JSON response from API")
+        raw_data["error"] = True
+    except requests.exceptions.RequestException as e:
+        print(f"  ❌ Stream interrupted: {type(e).__name__}")
+        raw_data["error"] = True
+    finally:
+        response.close()
+
+
 def fetch_flight_data() -> Optional[Dict[str, Any]]:
     """
     Query OpenSky Network API for aircraft in the bounding box.
     
     The API returns state vectors for all aircraft currently being
-    tracked within the specified geographic area.
+    tracked within the specified geographic area. The body is streamed:
+    state vectors are parsed lazily as the caller iterates them.
     
     Returns:
-        JSON response dict containing 'time' and 'states' keys,
+        Response dict containing 'time' and a lazy 'states' iterator,
         or None if request failed
     
     Raises:
@@ -174,7 +275,8 @@ def fetch_flight_data() -> Optional[Dict[str, Any]]:
             OPENSKY_API_URL,
             params=params,
             timeout=REQUEST_TIMEOUT,
-            headers={"Accept": "application/json"}
+            headers={"Accept": "application/json"},
+            stream=True,
         )
         
         # Check for rate limiting
@@ -183,12 +285,10 @@ def fetch_flight_data() -> Optional[Dict[str, Any]]:
             return None
         
         response.raise_for_status()
-        data = response.json()
-        
-        state_count = len(data.get("states", []) or [])
-        print(f"   Retrieved {state_count} aircraft state vectors")
         
-        return data
+        raw_data: Dict[str, Any] = {"time": None}
+        raw_data["states"] = stream_state_vectors(response, raw_data)
+        return raw_data
         
     except requests.exceptions.Timeout:
         print("  ❌ Request timed out. OpenSky may be experiencing high load.")
@@ -199,20 +299,63 @@ def fetch_flight_data() -> Optional[Dict[str, Any]]:
     except requests.exceptions.HTTPError as e:
         print(f"  ❌ HTTP error: {e}")
         return None
-    except json.JSONDecodeError:
-        print("  ❌ Invalid JSON response from API")
-        return None
 
 
-def parse_state_vector(state: List) -> Optional[Dict[str, Any]]:
+def build_aircraft(state: List, is_tagged: bool) -> Aircraft:
     """
-    Parse a single OpenSky state vector array into a clean dictionary.
+    Build the clean aircraft record for a state vector that has a position.
     
     Args:
         state: Array of values from OpenSky API response
+        is_tagged: Whether the aircraft meets the high_altitude_fast heuristic
         
     Returns:
-        Parsed aircraft dict, or None if essential data is missing
+        Parsed Aircraft record
+        
+    Raises:
+        TypeError, ValueError: If the coordinates are not numeric
+    """
+    geo_altitude = state[StateVectorIndex.GEO_ALTITUDE]
+    velocity = state[StateVectorIndex.VELOCITY]
+    
+    if is_tagged:
+        tag = "high_altitude_fast"
+        tag_reason = (
+            f"Alt: {geo_altitude:.0f}m (>{HIGH_ALTITUDE_THRESHOLD}m), "
+            f"Speed: {velocity:.0f}m/s (>{HIGH_VELOCITY_THRESHOLD}m/s)"
+        )
+    else:
+        tag = None
+        tag_reason = None
+    
+    # Positional construction, in Aircraft field order
+    return Aircraft(
+        state[StateVectorIndex.ICAO24],
+        (state[StateVectorIndex.CALLSIGN] or "").strip(),
+        state[StateVectorIndex.ORIGIN_COUNTRY],
+        float(state[StateVectorIndex.LONGITUDE]),
+        float(state[StateVectorIndex.LATITUDE]),
+        geo_altitude,
+        velocity,
+        state[StateVectorIndex.ON_GROUND],
+        state[StateVectorIndex.TRUE_TRACK],
+        state[StateVectorIndex.VERTICAL_RATE],
+        tag,
+        tag_reason,
+    )
+
+
+def parse_state_vector(state: List) -> Optional[Aircraft]:
+    """
+    Parse a single OpenSky state vector array into a clean Aircraft record.
+    
+    Scalar fallback for chunks the vectorized path cannot handle.
+    
+    Args:
+        state: Array of values from OpenSky API response
+        
+    Returns:
+        Parsed Aircraft record, or None if essential data is missing
     """
     try:
         # Skip if no position data (aircraft not transmitting location)
@@ -220,69 +363,135 @@ def parse_state_vector(state: List) -> Optional[Dict[str, Any]]:
            state[StateVectorIndex.LATITUDE] is None:
             return None
         
-        # Extract core fields
-        aircraft = {
-            "icao24": state[StateVectorIndex.ICAO24],
-            "callsign": (state[StateVectorIndex.CALLSIGN] or "").strip(),
-            "origin_country": state[StateVectorIndex.ORIGIN_COUNTRY],
-            "longitude": float(state[StateVectorIndex.LONGITUDE]),
-            "latitude": float(state[StateVectorIndex.LATITUDE]),
-            "geo_altitude": state[StateVectorIndex.GEO_ALTITUDE],
-            "velocity": state[StateVectorIndex.VELOCITY],
-            "on_ground": state[StateVectorIndex.ON_GROUND],
-            "true_track": state[StateVectorIndex.TRUE_TRACK],
-            "vertical_rate": state[StateVectorIndex.VERTICAL_RATE],
-        }
-        
         # Apply heuristic filter: High altitude + Fast = Potentially significant
         # This is a proxy for military/fast jet detection without ICAO database
-        altitude = aircraft["geo_altitude"] or 0
-        velocity = aircraft["velocity"] or 0
+        altitude = state[StateVectorIndex.GEO_ALTITUDE] or 0
+        velocity = state[StateVectorIndex.VELOCITY] or 0
         
         is_high_altitude = altitude > HIGH_ALTITUDE_THRESHOLD
         is_high_velocity = velocity > HIGH_VELOCITY_THRESHOLD
         
-        if is_high_altitude and is_high_velocity:
-            aircraft["tag"] = "high_altitude_fast"
-            aircraft["tag_reason"] = (
-                f"Alt: {altitude:.0f}m (>{HIGH_ALTITUDE_THRESHOLD}m), "
-                f"Speed: {velocity:.0f}m/s (>{HIGH_VELOCITY_THRESHOLD}m/s)"
-            )
-        else:
-            aircraft["tag"] = None
-            aircraft["tag_reason"] = None
-        
-        return aircraft
+        return build_aircraft(state, is_high_altitude and is_high_velocity)
         
     except (IndexError, TypeError, ValueError) as e:
         # Malformed state vector, skip it
         return None
 
 
-def process_flight_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+def compute_state_masks(states: List[List]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Evaluate the position filter and heuristic tag for a chunk in one pass.
+    
+    The chunk is viewed as a 2-D object array so the None checks and the
+    altitude/velocity thresholds run as NumPy column operations instead of
+    per-row Python comparisons.
+    
+    Args:
+        states: Chunk of state vector arrays
+        
+    Returns:
+        Tuple of (row indices with a position, per-row tag mask),
+        or None if the chunk is ragged or non-numeric
+    """
+    grid = np.array(states, dtype=object)
+    if grid.ndim != 2 or grid.shape[1] <= StateVectorIndex.GEO_ALTITUDE:
+        return None
+    
+    longitude = grid[:, StateVectorIndex.LONGITUDE]
+    latitude = grid[:, StateVectorIndex.LATITUDE]
+    altitude = grid[:, StateVectorIndex.GEO_ALTITUDE]
+    velocity = grid[:, StateVectorIndex.VELOCITY]
+    
+    has_position = (longitude != None) & (latitude != None)  # noqa: E711
+    
+    try:
+        altitude = np.where(altitude == None, np.nan, altitude).astype(float)  # noqa: E711
+        velocity = np.where(velocity == None, np.nan, velocity).astype(float)  # noqa: E711
+    except (TypeError, ValueError):
+        return None
+    
+    # NaN (missing) never passes a threshold
+    is_tagged = (altitude > HIGH_ALTITUDE_THRESHOLD) & (velocity > HIGH_VELOCITY_THRESHOLD)
+    
+    return np.flatnonzero(has_position), is_tagged
+
+
+def parse_state_chunk(states: List[List]) -> List[Aircraft]:
+    """
+    Parse a chunk of state vectors, keeping only aircraft with a position.
+    
+    Records are only built for the rows that survive the vectorized filter.
+    
+    Args:
+        states: Chunk of state vector arrays
+        
+    Returns:
+        List of parsed Aircraft records
+    """
+    masks = compute_state_masks(states)
+    if masks is None:
+        parsed = (parse_state_vector(state) for state in states)
+        return [aircraft for aircraft in parsed if aircraft]
+    
+    positioned, is_tagged = masks
+    aircraft_list = []
+    
+    for i in positioned:
+        try:
+            aircraft_list.append(build_aircraft(states[i], bool(is_tagged[i])))
+        except (TypeError, ValueError):
+            # Malformed coordinates, skip it
+            continue
+    
+    return aircraft_list
+
+
+def process_flight_data(
+    raw_data: Dict[str, Any],
+    chunk_size: int = STATE_CHUNK_SIZE
+) -> Optional[Dict[str, Any]]:
     """
     Process raw OpenSky response into clean, structured output.
     
+    State vectors are consumed in a single pass of fixed-size chunks: each
+    chunk is filtered and tagged with vectorized NumPy masks as it arrives,
+    so only the surviving aircraft are kept in memory.
+    
     Args:
-        raw_data: Raw JSON response from OpenSky API
+        raw_data: OpenSky response with 'time' and an iterable of 'states'
+        chunk_size: State vectors per chunk
         
     Returns:
-        Structured dict with metadata and parsed aircraft list
+        Structured dict with metadata and Aircraft records, or None if
+        the response stream failed before it was fully read
     """
-    states = raw_data.get("states") or []
-    api_time = raw_data.get("time", 0)
+    states = iter(raw_data.get("states") or [])
     
-    # Parse all state vectors
+    # Parse all state vectors, one chunk at a time
     aircraft_list = []
     tagged_count = 0
+    state_count = 0
     
-    for state in states:
-        aircraft = parse_state_vector(state)
-        if aircraft:
+    while True:
+        chunk = list(islice(states, chunk_size))
+        if not chunk:
+            break
+        
+        state_count += len(chunk)
+        for aircraft in parse_state_chunk(chunk):
             aircraft_list.append(aircraft)
-            if aircraft.get("tag") == "high_altitude_fast":
+            if aircraft.tag == "high_altitude_fast":
                 tagged_count += 1
     
+    # Read after the stream is drained - the timestamp, the rows dropped
+    # while decoding and any stream error are recorded as it is parsed
+    if raw_data.get("error"):
+        return None
+    
+    api_time = raw_data.get("time") or 0
+    state_count += raw_data.get("dropped", 0)
+    print(f"   Retrieved {state_count} aircraft state vectors")
+    
     # Build output structure
     output = {
         "metadata": {
@@ -305,15 +514,30 @@ def process_flight_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     if tagged_count > 0:
         print(f"\n   ⚠️  High Altitude + Fast Aircraft:")
         for ac in aircraft_list:
-            if ac.get("tag") == "high_altitude_fast":
-                print(f"      └─ {ac['callsign'] or ac['icao24']}: "
-                      f"{ac['origin_country']}, "
-                      f"Alt: {ac['geo_altitude']:.0f}m, "
-                      f"Speed: {ac['velocity']:.0f}m/s")
+            if ac.tag == "high_altitude_fast":
+                print(f"      └─ {ac.callsign or ac.icao24}: "
+                      f"{ac.origin_country}, "
+                      f"Alt: {ac.geo_altitude:.0f}m, "
+                      f"Speed: {ac.velocity:.0f}m/s")
     
     return output
 
 
+def serialize_record(obj: Any) -> Dict[str, Any]:
+    """
+    orjson fallback serializer for Aircraft records.
+    
+    Args:
+        obj: Object orjson cannot serialize natively
+        
+    Returns:
+        Field dict for the record
+    """
+    if isinstance(obj, Aircraft):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
 def save_flight_data(data: Dict[str, Any], filepath: Path) -> None:
     """
     Save processed flight data to JSON file.
@@ -325,57 +549,97 @@ def save_flight_data(data: Dict[str, Any], filepath: Path) -> None:
     # Ensure output directory exists
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write with pretty formatting
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Write with pretty formatting (orjson emits UTF-8 bytes directly);
+    # Aircraft records become dicts only here, at the serialization point
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(data, default=serialize_record, option=orjson.OPT_INDENT_2))
     
     print(f"\n💾 Saved to {filepath}")
 
 
-def main():
+def aircraft_to_frame(aircraft_list: List[Aircraft]) -> pd.DataFrame:
     """
-    Main entry point for Agent_Skywatcher.
+    Materialize Aircraft records as a columnar DataFrame.
     
-    Orchestrates the flight tracking pipeline:
-    1. Query OpenSky Network API for aircraft in bounding box
-    2. Parse state vectors into clean format
-    3. Apply heuristic tagging for potentially significant aircraft
-    4. Save to output file
+    Args:
+        aircraft_list: Parsed Aircraft records
+        
+    Returns:
+        DataFrame with one column per Aircraft field (missing values as NaN)
     """
-    # Fetch raw data from OpenSky
-    raw_data = fetch_flight_data()
+    frame = pd.DataFrame.from_records(aircraft_list, columns=Aircraft._fields)
+    
+    # Pin numeric dtypes so an empty or all-null column keeps the same schema
+    return frame.astype({
+        "longitude": "float64",
+        "latitude": "float64",
+        "geo_altitude": "float64",
+        "velocity": "float64",
+        "true_track": "float64",
+        "vertical_rate": "float64",
+        "on_ground": "bool",
+    })
+
+
+def save_flight_parquet(aircraft_list: List[Aircraft], filepath: Path) -> None:
+    """
+    Save the aircraft as a ZSTD-compressed Parquet file.
     
-    if raw_data is None:
-        print("\n❌ Failed to fetch flight data. Exiting.")
-        sys.exit(1)
+    Downstream consumers can load or filter single columns (e.g. 'tag')
+    without parsing the JSON document. Skipped if no Parquet engine is
+    installed; the JSON output remains the primary artifact.
     
-    if not raw_data.get("states"):
-        print("\n📭 No aircraft found in the specified bounding box.")
-        # Save empty result for consistency
-        empty_result = {
-            "metadata": {
-                "source": "OpenSky Network",
-                "query_timestamp": datetime.now(timezone.utc).isoformat(),
-                "bounding_box": BOUNDING_BOX,
-                "total_aircraft": 0,
-                "tagged_high_altitude_fast": 0,
-            },
-            "aircraft": [],
-        }
-        save_flight_data(empty_result, OUTPUT_FILE)
-        print(f"\n🎯 Found 0 aircraft in the danger zone.")
+    Args:
+        aircraft_list: Parsed Aircraft records
+        filepath: Output file path
+    """
+    try:
+        aircraft_to_frame(aircraft_list).to_parquet(
+            filepath, compression="zstd", index=False
+        )
+    except ImportError:
+        print("   ⚠️  pyarrow not installed - skipping Parquet output")
         return
     
-    # Process and structure the data
-    processed_data = process_flight_data(raw_data)
+    print(f"💾 Saved to {filepath}")
+
+
+def collect_flight_data() -> Optional[Dict[str, Any]]:
+    """
+    Query OpenSky and parse the streamed response in one step.
+    
+    Returns:
+        Processed flight data, or None if the request failed
+    """
+    raw_data = fetch_flight_data()
+    
+    if raw_data is None:
+        return None
     
-    # Save to output file
+    # Process and structure the data (consumes the streamed state vectors)
+    return process_flight_data(raw_data)
+
+
+def report_flight_data(processed_data: Dict[str, Any]) -> None:
+    """
+    Save processed flight data and print the run summary.
+    
+    Args:
+        processed_data: Result of collect_flight_data()
+    """
+    # Save to output file (an empty result is saved too, for consistency)
     save_flight_data(processed_data, OUTPUT_FILE)
+    save_flight_parquet(processed_data["aircraft"], PARQUET_FILE)
     
     # Final summary
     total = processed_data["metadata"]["total_aircraft"]
     tagged = processed_data["metadata"]["tagged_high_altitude_fast"]
     
+    if total == 0:
+        print("\n📭 No aircraft found in the specified bounding box.")
+        print(f"\n🎯 Found 0 aircraft in the danger zone.")
+        return
+    
     print("\n" + "=" * 70)
     print(f"🎯 Found {total} aircraft in the danger zone.")
     if tagged > 0:
@@ -383,5 +647,24 @@ def main():
     print("=" * 70)
 
 
+def main():
+    """
+    Main entry point for Agent_Skywatcher.
+    
+    Orchestrates the flight tracking pipeline:
+    1. Query OpenSky Network API for aircraft in bounding box
+    2. Parse state vectors into clean format
+    3. Apply heuristic tagging for potentially significant aircraft
+    4. Save to output file
+    """
+    processed_data = collect_flight_data()
+    
+    if processed_data is None:
+        print("\n❌ Failed to fetch flight data. Exiting.")
+        sys.exit(1)
+    
+    report_flight_data(processed_data)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+==============================================================================
+LIVE FETCH: Combined News + Flight Ingestion for Project Sentinel
+==============================================================================
+
+Purpose:
+    Runs Agent_News and Agent_Skywatcher together. Both agents spend almost
+    all of their time waiting on remote HTTP, so their network phases are
+    multiplexed onto one asyncio event loop instead of running back to back.
+
+Concurrency Model:
+    -------------------------------------------------------------------------
+    The agents keep their blocking requests sessions (pooled, retrying,
+    streaming) and are dispatched with asyncio.to_thread:
+    
+    - News: every RSS feed is fetched concurrently by fetch_all_feeds()
+    - Flights: the OpenSky query is streamed and parsed as it arrives
+    
+    The run takes roughly as long as the slower of the two network phases.
+    Archiving and saving happen afterwards, one agent at a time, so the
+    summaries are printed in order.
+    -------------------------------------------------------------------------
+
+Usage:
+    python agents/fetch_live.py
+
+Author: Project Sentinel Team
+Created: 2026
+==============================================================================
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import fetch_flights
+import fetch_news
+
+
+async def fetch_all_sources(
+    feed_cache: Dict[str, Dict[str, Optional[str]]]
+) -> Tuple[Tuple[List[Dict[str, Any]], List[str], List[str]], Optional[Dict[str, Any]]]:
+    """
+    Fetch all RSS feeds and the OpenSky state vectors concurrently.
+    
+    Args:
+        feed_cache: Per-source conditional GET validators for the news feeds
+    
+    Returns:
+        Tuple of (news fetch result, processed flight data or None)
+    """
+    news_result, flight_data = await asyncio.gather(
+        asyncio.to_thread(fetch_news.fetch_all_feeds, feed_cache),
+        asyncio.to_thread(fetch_flights.collect_flight_data),
+    )
+    return news_result, flight_data
+
+
+def main():
+    """
+    Main entry point for the combined live fetch.
+    
+    1. Fetch news feeds and flight data concurrently
+    2. Archive the news articles
+    3. Save the flight data
+    """
+    print("=" * 70)
+    print("🛰️  LIVE FETCH: News + Flight Ingestion")
+    print("   Project Sentinel - Concurrent Source Polling")
+    print("=" * 70)
+    
+    print(f"\n🔄 Fetching {len(fetch_news.SOURCE_CONFIG)} feeds and OpenSky state vectors...")
+    feed_cache = fetch_news.load_feed_cache(fetch_news.FEED_CACHE_FILE)
+    news_result, flight_data = asyncio.run(fetch_all_sources(feed_cache))
+    
+    fetch_news.archive_articles(news_result, feed_cache)
+    
+    if flight_data is None:
+        print("\n❌ Failed to fetch flight data.")
+    else:
+        fetch_flights.report_flight_data(flight_data)
+
+
+if __name__ == "__main__":
+    main()
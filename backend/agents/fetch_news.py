@@ -40,18 +40,29 @@ Created: 2026
 ==============================================================================
 """
 
+import calendar
 import hashlib
 import html
-import json
+import mmap
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import itemgetter
 
 import feedparser
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+from lxml import html as lxml_html
 
 # ==============================================================================
 # SOURCE REGISTRY CONFIGURATION
@@ -110,7 +121,11 @@ SOURCE_CONFIG: Dict[str, Dict[str, Any]] = {
 
 # Output configuration
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "data"
-OUTPUT_FILE = OUTPUT_DIR / "news_feed.json"
+OUTPUT_FILE = OUTPUT_DIR / "news_feed.jsonl"     # Append-only, one article per line
+IDS_FILE = OUTPUT_DIR / "news_feed.ids"          # Packed 8-byte IDs for dedupe
+META_FILE = OUTPUT_DIR / "news_feed.meta.json"   # Run metadata and counts
+LEGACY_FILE = OUTPUT_DIR / "news_feed.json"      # Pre-NDJSON archive (migrated once)
+FEED_CACHE_FILE = OUTPUT_DIR / "feed_meta.json"  # Per-source ETag/Last-Modified
 
 # HTTP configuration
 # Spoof a real browser User-Agent to avoid aggressive blocking (e.g., Reuters)
@@ -120,6 +135,40 @@ USER_AGENT = (
 )
 REQUEST_TIMEOUT = 15  # seconds
 
+# Keep-alive connections per host; sized above the source count so every
+# concurrent worker gets a pooled connection instead of a fresh TLS handshake
+POOL_SIZE = 16
+
+# Article ID scheme, recorded in the output metadata so caches written with
+# an older scheme (truncated SHA-256) are re-keyed once on load
+ID_SCHEME = "blake2b-64"
+ID_BYTES = 8
+
+# Bloom prefilter over archived IDs: 10 bits and 7 probes per ID gives a
+# ~1% false-positive rate (false positives only cost an exact lookup)
+BLOOM_BITS_PER_ID = 10
+BLOOM_PROBES = 7
+BLOOM_MIN_BITS = 1 << 16
+
+# Published dates are normalized to second-precision UTC ISO 8601
+ISO_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+# Summaries are capped by UTF-8 size, not character count, so saved records
+# stay bounded for non-Latin feeds (Arabic, Cyrillic)
+SUMMARY_MAX_BYTES = 500
+
+# Feeds are fetched concurrently; each worker buffers its log lines and
+# emits them under this lock so output from different sources never interleaves
+_print_lock = threading.Lock()
+
+# Precompiled text-cleaning patterns (strip_html_tags runs per title/summary)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Article IDs as they appear in the NDJSON archive. Quotes inside string
+# values are escaped, so titles/summaries can never produce a match
+_ARCHIVE_ID_RE = re.compile(rb'"id"\s*:\s*"([0-9a-f]{16})"')
+
 
 # ==============================================================================
 # UTILITY FUNCTIONS
@@ -129,19 +178,19 @@ def generate_article_id(url: str) -> str:
     """
     Generate a deterministic, unique article ID by hashing the URL.
     
-    Using SHA256 for collision resistance. The URL is the most reliable
-    unique identifier for articles (titles can be edited, GUIDs may not exist).
+    Using BLAKE2b with a native 8-byte digest: faster than SHA-256 and no
+    truncation needed. The URL is the most reliable unique identifier for
+    articles (titles can be edited, GUIDs may not exist).
     
     Args:
         url: Article URL
         
     Returns:
-        First 16 characters of SHA256 hash (64-bit identifier)
+        16 hex characters (64-bit identifier)
     """
     # Normalize URL: strip whitespace, lowercase for consistency
     normalized = url.strip().lower()
-    hash_obj = hashlib.sha256(normalized.encode('utf-8'))
-    return hash_obj.hexdigest()[:16]
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
 
 
 def strip_html_tags(text: str) -> str:
@@ -149,7 +198,9 @@ def strip_html_tags(text: str) -> str:
     Remove HTML tags and decode HTML entities from text.
     
     RSS feeds often contain HTML markup in summaries. We need clean text
-    for downstream NLP processing.
+    for downstream NLP processing. Tag-free strings skip markup handling
+    entirely; marked-up strings go through lxml's C parser, which also
+    copes with malformed HTML.
     
     Args:
         text: Raw text potentially containing HTML
@@ -160,17 +211,72 @@ def strip_html_tags(text: str) -> str:
     if not text:
         return ""
     
-    # Remove HTML tags using regex
-    # This handles <p>, <br>, <a href="...">, etc.
-    clean = re.sub(r'<[^>]+>', '', text)
+    if '<' not in text:
+        # No markup: decode entities like &amp;, &quot;, &#39; and normalize
+        return _WS_RE.sub(' ', html.unescape(text)).strip()
     
-    # Decode HTML entities like &amp;, &quot;, &#39;
-    clean = html.unescape(clean)
+    try:
+        # text_content() drops all tags and decodes entities in one pass
+        clean = lxml_html.fromstring(text).text_content()
+    except (etree.ParserError, ValueError):
+        # Unparseable fragment (e.g. only comments): regex fallback
+        clean = html.unescape(_TAG_RE.sub('', text))
     
     # Normalize whitespace
-    clean = re.sub(r'\s+', ' ', clean).strip()
+    return _WS_RE.sub(' ', clean).strip()
+
+
+def truncate_utf8(text: str, max_bytes: int = SUMMARY_MAX_BYTES) -> str:
+    """
+    Truncate text to at most max_bytes of UTF-8 without splitting a character.
+    
+    Args:
+        text: Text to truncate
+        max_bytes: UTF-8 byte budget
+        
+    Returns:
+        The text itself if it fits, else its longest prefix that does
+    """
+    # A character is at most 4 bytes, and ASCII is exactly 1 - neither case
+    # needs an encoded copy
+    if len(text) * 4 <= max_bytes:
+        return text
+    if text.isascii():
+        return text[:max_bytes]
+    
+    encoded = text.encode('utf-8')
+    if len(encoded) <= max_bytes:
+        return text
+    # 'ignore' drops a multi-byte sequence cut off at the boundary
+    return encoded[:max_bytes].decode('utf-8', 'ignore')
+
+
+@lru_cache(maxsize=4096)
+def parse_date_string(published_str: str) -> Optional[str]:
+    """
+    Parse a raw RFC 2822 date string to UTC ISO format.
+    
+    Memoized: entries within and across feeds often share the exact same
+    timestamp string, so repeats skip the pure-Python re-tokenizing.
     
-    return clean
+    Args:
+        published_str: Raw published/updated string from the feed
+        
+    Returns:
+        ISO 8601 UTC timestamp string, or None if unparseable
+    """
+    try:
+        # parsedate_to_datetime handles RFC 2822 format (common in RSS)
+        dt = parsedate_to_datetime(published_str)
+    except (ValueError, TypeError):
+        return None
+    
+    # Convert to UTC if timezone-aware
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc)
+    else:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.strftime(ISO_UTC_FORMAT)
 
 
 def parse_published_date(entry: Dict) -> Optional[str]:
@@ -186,29 +292,20 @@ def parse_published_date(entry: Dict) -> Optional[str]:
     Returns:
         ISO 8601 UTC timestamp string, or None if unparseable
     """
-    # Try feedparser's pre-parsed date first
+    # Fast path: feedparser's pre-parsed (UTC) struct_time, converted in C
     if hasattr(entry, 'published_parsed') and entry.published_parsed:
         try:
-            # struct_time to datetime
-            dt = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            return dt.isoformat().replace('+00:00', 'Z')
-        except (ValueError, TypeError):
+            timestamp = calendar.timegm(entry.published_parsed)
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(ISO_UTC_FORMAT)
+        except (ValueError, TypeError, OverflowError):
             pass
     
     # Fallback: try parsing the raw published string
     published_str = entry.get('published') or entry.get('updated', '')
     if published_str:
-        try:
-            # parsedate_to_datetime handles RFC 2822 format (common in RSS)
-            dt = parsedate_to_datetime(published_str)
-            # Convert to UTC if timezone-aware
-            if dt.tzinfo:
-                dt = dt.astimezone(timezone.utc)
-            else:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.isoformat().replace('+00:00', 'Z')
-        except (ValueError, TypeError):
-            pass
+        parsed = parse_date_string(published_str)
+        if parsed:
+            return parsed
     
     # Last resort: use current time
     return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
@@ -218,26 +315,53 @@ def parse_published_date(entry: Dict) -> Optional[str]:
 # FEED FETCHING AND PROCESSING
 # ==============================================================================
 
-def fetch_feed(source_id: str, config: Dict) -> List[Dict[str, Any]]:
+def emit_log(lines: List[str]) -> None:
+    """
+    Print a block of log lines atomically.
+    
+    Args:
+        lines: Lines buffered by a single worker
+    """
+    with _print_lock:
+        for line in lines:
+            print(line)
+
+
+def fetch_feed(
+    session: requests.Session,
+    source_id: str,
+    config: Dict,
+    feed_cache: Dict[str, Dict[str, Optional[str]]]
+) -> Optional[List[Dict[str, Any]]]:
     """
     Fetch and parse a single RSS feed.
     
     Uses requests library for HTTP fetching (more reliable than feedparser's
-    internal urllib) and feedparser for XML parsing only.
+    internal urllib) and feedparser for XML parsing only. Safe to call from
+    worker threads: the session is shared for connection pooling and all
+    output is buffered and emitted in one block when the fetch completes.
+    
+    The request is conditional: validators from the previous successful
+    fetch are sent as If-None-Match/If-Modified-Since, so an unchanged feed
+    costs a bodiless 304 and no parsing. New validators are written back
+    into feed_cache (each worker only touches its own source_id key).
     
     Args:
+        session: Shared requests session (keep-alive connection pool)
         source_id: Unique identifier for this source
         config: Source configuration dict
+        feed_cache: Per-source {"etag", "last_modified"} validators
         
     Returns:
-        List of parsed article dicts
+        List of parsed article dicts (empty on failure),
+        or None if the feed is unchanged since the last run
     """
     url = config["url"]
     tier = config["tier"]
     source_type = config["type"]
     name = config.get("name", source_id)
     
-    print(f"   📰 {name} (Tier {tier}, {source_type})...")
+    log = [f"   📰 {name} (Tier {tier}, {source_type})..."]
     
     try:
         # Use requests for HTTP fetching (more reliable than feedparser's urllib)
@@ -246,18 +370,35 @@ def fetch_feed(source_id: str, config: Dict) -> List[Dict[str, Any]]:
             "Accept": "application/rss+xml, application/xml, text/xml, */*"
         }
         
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        validators = feed_cache.get(source_id, {})
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        
+        response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        
+        if response.status_code == 304:
+            log.append(f"      ⏸️  Not modified since last run")
+            return None
+        
         response.raise_for_status()
         
-        # Parse the content with feedparser (XML parsing only)
-        feed = feedparser.parse(response.content)
+        # Parse the content with feedparser (XML parsing only). Its HTML
+        # sanitizer and relative-URI resolver are skipped: every title and
+        # summary goes through strip_html_tags anyway, so that work is wasted
+        feed = feedparser.parse(
+            response.content,
+            sanitize_html=False,
+            resolve_relative_uris=False,
+        )
         
         # Check for parse errors
         if feed.bozo and feed.bozo_exception:
-            print(f"      ⚠️  Parse warning: {type(feed.bozo_exception).__name__}")
+            log.append(f"      ⚠️  Parse warning: {type(feed.bozo_exception).__name__}")
         
         if not feed.entries:
-            print(f"      ⚠️  No entries found")
+            log.append(f"      ⚠️  No entries found")
             return []
         
         articles = []
@@ -282,43 +423,109 @@ def fetch_feed(source_id: str, config: Dict) -> List[Dict[str, Any]]:
             article = {
                 "id": article_id,
                 "source_id": source_id,
-                "source_tier": tier,
-                "source_type": source_type,
                 "title": title,
-                "summary": summary[:500] if summary else "",  # Truncate long summaries
+                "summary": truncate_utf8(summary) if summary else "",  # Bounded UTF-8 size
                 "link": link,
                 "published_utc": published,
             }
             
             articles.append(article)
         
-        print(f"      ✓ Fetched {len(articles)} articles")
+        # Only remember validators once the body has been fully processed
+        feed_cache[source_id] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        
+        log.append(f"      ✓ Fetched {len(articles)} articles")
         return articles
     
     except requests.exceptions.Timeout:
-        print(f"      ❌ Timeout: Feed took too long to respond")
+        log.append(f"      ❌ Timeout: Feed took too long to respond")
         return []
     except requests.exceptions.HTTPError as e:
-        print(f"      ❌ HTTP Error: {e.response.status_code}")
+        log.append(f"      ❌ HTTP Error: {e.response.status_code}")
         return []
     except requests.exceptions.RequestException as e:
-        print(f"      ❌ Request Error: {type(e).__name__}")
+        log.append(f"      ❌ Request Error: {type(e).__name__}")
         return []
     except Exception as e:
-        print(f"      ❌ Error: {type(e).__name__}: {e}")
+        log.append(f"      ❌ Error: {type(e).__name__}: {e}")
         return []
+    finally:
+        emit_log(log)
+
+
+class ArticleIdIndex:
+    """
+    Compact membership index over archived article IDs.
+    
+    IDs are kept as a sorted uint64 array (8 bytes per ID instead of a
+    hex string per set entry), fronted by a Bloom filter. Since IDs are
+    already hash digests, the probe positions come straight from their
+    two 32-bit halves - no rehashing. Most new articles are rejected by
+    the filter; only filter hits pay for the exact binary search.
+    """
+    
+    def __init__(self, packed: bytes = b''):
+        """
+        Args:
+            packed: Concatenated 8-byte big-endian IDs (the .ids sidecar)
+        """
+        ids = np.frombuffer(packed, dtype='>u8').astype(np.uint64)
+        self._sorted = np.sort(ids)
+        self._added: set = set()
+        
+        # Power-of-two size, so a probe position is a mask instead of a modulo
+        bits = max(BLOOM_MIN_BITS, len(ids) * BLOOM_BITS_PER_ID)
+        self._mask = (1 << (bits - 1).bit_length()) - 1
+        
+        flags = np.zeros(self._mask + 1, dtype=np.bool_)
+        if len(ids):
+            low = ids & np.uint64(0xFFFFFFFF)
+            high = (ids >> np.uint64(32)) | np.uint64(1)
+            probes = np.arange(BLOOM_PROBES, dtype=np.uint64)
+            flags[(low[:, None] + probes * high[:, None]) & np.uint64(self._mask)] = True
+        self._bloom = bytearray(np.packbits(flags, bitorder='little').tobytes())
+    
+    def _probes(self, value: int) -> Iterator[int]:
+        low = value & 0xFFFFFFFF
+        high = (value >> 32) | 1
+        for i in range(BLOOM_PROBES):
+            yield (low + i * high) & self._mask
+    
+    def __contains__(self, article_id: str) -> bool:
+        value = int(article_id, 16)
+        bloom = self._bloom
+        for pos in self._probes(value):
+            if not bloom[pos >> 3] & (1 << (pos & 7)):
+                return False
+        
+        if article_id in self._added:
+            return True
+        i = np.searchsorted(self._sorted, np.uint64(value))
+        return bool(i < len(self._sorted) and self._sorted[i] == value)
+    
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._added)
+    
+    def add(self, article_id: str) -> None:
+        """Record an ID seen during this run."""
+        self._added.add(article_id)
+        for pos in self._probes(int(article_id, 16)):
+            self._bloom[pos >> 3] |= 1 << (pos & 7)
 
 
 def deduplicate_articles(
     new_articles: List[Dict], 
-    existing_ids: set
+    existing_ids: ArticleIdIndex
 ) -> tuple[List[Dict], int]:
     """
     Remove duplicate articles based on their deterministic IDs.
     
     Args:
         new_articles: List of newly fetched articles
-        existing_ids: Set of already-seen article IDs
+        existing_ids: Index of already-seen article IDs
         
     Returns:
         Tuple of (unique articles list, count of duplicates skipped)
@@ -337,101 +544,282 @@ def deduplicate_articles(
     return unique, duplicates
 
 
-def load_existing_articles(filepath: Path) -> tuple[List[Dict], set]:
+def scan_archive_ids(filepath: Path) -> bytes:
+    """
+    Extract article IDs from the NDJSON archive without parsing any JSON.
+    
+    The file is memory-mapped and scanned by the C regex engine, so no
+    article is decoded and the archive is never copied into a Python buffer.
+    
+    Args:
+        filepath: Path to the NDJSON archive
+        
+    Returns:
+        Packed 8-byte IDs, in archive order
+    """
+    if filepath.stat().st_size == 0:
+        return b''
+    
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return b''.join(
+                bytes.fromhex(m.group(1).decode('ascii'))
+                for m in _ARCHIVE_ID_RE.finditer(mm)
+            )
+
+
+def load_existing_ids(filepath: Path, archive: Path) -> ArticleIdIndex:
     """
-    Load existing articles from output file to enable deduplication.
+    Load the IDs of already-archived articles to enable deduplication.
+    
+    Only the packed ID sidecar is read - no article bodies and no JSON -
+    so the cost stays O(ids) however large the archive grows. A missing
+    sidecar is rebuilt from an mmap scan of the archive.
+    
+    Args:
+        filepath: Path to the packed 8-byte ID file
+        archive: Path to the NDJSON archive the sidecar indexes
+        
+    Returns:
+        Index of existing article IDs (queried with 16-char hex strings)
+    """
+    if not filepath.exists():
+        if not archive.exists():
+            return ArticleIdIndex()
+        
+        packed = scan_archive_ids(archive)
+        filepath.write_bytes(packed)
+        return ArticleIdIndex(packed)
+    
+    buf = filepath.read_bytes()
+    # Ignore a trailing partial record left by an interrupted write
+    end = len(buf) - len(buf) % ID_BYTES
+    return ArticleIdIndex(buf[:end])
+
+
+def load_metadata(filepath: Path) -> Dict[str, Any]:
+    """
+    Load the archive metadata (counts carried across runs).
     
     Args:
-        filepath: Path to existing JSON file
+        filepath: Path to the metadata JSON file
         
     Returns:
-        Tuple of (existing articles list, set of existing IDs)
+        Metadata dict, empty if missing or unreadable
     """
     if not filepath.exists():
-        return [], set()
+        return {}
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            articles = data.get("articles", [])
-            ids = {a["id"] for a in articles}
-            return articles, ids
-    except (json.JSONDecodeError, KeyError):
-        return [], set()
+        return orjson.loads(filepath.read_bytes())
+    except orjson.JSONDecodeError:
+        return {}
 
 
-def save_articles(articles: List[Dict], filepath: Path) -> None:
+def load_feed_cache(filepath: Path) -> Dict[str, Dict[str, Optional[str]]]:
     """
-    Save articles to JSON file with metadata.
+    Load the per-source HTTP validators used for conditional GETs.
     
     Args:
-        articles: List of article dicts
+        filepath: Path to the feed cache JSON file
+        
+    Returns:
+        Mapping of source_id to {"etag", "last_modified"}, empty if missing
+    """
+    if not filepath.exists():
+        return {}
+    
+    try:
+        return orjson.loads(filepath.read_bytes())
+    except orjson.JSONDecodeError:
+        return {}
+
+
+def save_feed_cache(feed_cache: Dict[str, Dict[str, Optional[str]]], filepath: Path) -> None:
+    """
+    Persist the per-source HTTP validators for the next run.
+    
+    Args:
+        feed_cache: Mapping of source_id to {"etag", "last_modified"}
         filepath: Output file path
     """
     filepath.parent.mkdir(parents=True, exist_ok=True)
+    filepath.write_bytes(orjson.dumps(feed_cache, option=orjson.OPT_INDENT_2))
+
+
+def save_articles(articles: List[Dict], metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Append new articles to the archive and refresh the metadata file.
+    
+    Write I/O is proportional to the new articles only: the NDJSON archive
+    and the ID sidecar are append-only, and per-source counts are updated
+    incrementally in the small metadata file.
+    
+    Args:
+        articles: List of new (deduplicated) article dicts
+        metadata: Metadata from the previous run
+        
+    Returns:
+        Updated metadata dict
+    """
+    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(OUTPUT_FILE, 'ab') as f:
+        f.write(b''.join(orjson.dumps(article) + b'\n' for article in articles))
+    
+    # IDs go in after the articles: an interrupted run can at worst repeat
+    # an archive line on the next run (the ETL merges on id), never lose one
+    with open(IDS_FILE, 'ab') as f:
+        f.write(b''.join(bytes.fromhex(a["id"]) for a in articles))
     
     # Count by source for metadata
-    by_source = {}
+    by_source = dict(metadata.get("articles_by_source", {}))
     for article in articles:
         source = article["source_id"]
         by_source[source] = by_source.get(source, 0) + 1
     
-    output = {
-        "metadata": {
-            "last_updated": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
-            "total_articles": len(articles),
-            "sources": list(SOURCE_CONFIG.keys()),
-            "articles_by_source": by_source,
+    metadata = {
+        "last_updated": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "id_scheme": ID_SCHEME,
+        "total_articles": metadata.get("total_articles", 0) + len(articles),
+        "sources": list(SOURCE_CONFIG.keys()),
+        # Tier/type live here once rather than on every article line
+        "source_registry": {
+            source_id: {"tier": config["tier"], "type": config["type"]}
+            for source_id, config in SOURCE_CONFIG.items()
         },
-        "articles": articles,
+        "articles_by_source": by_source,
     }
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(META_FILE, 'wb') as f:
+        f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    
+    print(f"\n💾 Saved to {OUTPUT_FILE}")
+    return metadata
+
+
+def migrate_legacy_archive() -> int:
+    """
+    Convert the legacy single-document news_feed.json to the NDJSON archive.
+    
+    Runs once: skipped when the NDJSON archive already exists. Articles
+    written under an older ID scheme are re-keyed from their links.
+    
+    Returns:
+        Number of articles migrated
+    """
+    if OUTPUT_FILE.exists() or not LEGACY_FILE.exists():
+        return 0
+    
+    try:
+        data = orjson.loads(LEGACY_FILE.read_bytes())
+    except orjson.JSONDecodeError:
+        return 0
+    
+    articles = data.get("articles", [])
+    if data.get("metadata", {}).get("id_scheme") != ID_SCHEME:
+        for article in articles:
+            article["id"] = generate_article_id(article["link"])
     
-    print(f"\n💾 Saved to {filepath}")
+    # Source tier/type are now kept in the metadata's source_registry
+    for article in articles:
+        article.pop("source_tier", None)
+        article.pop("source_type", None)
+    
+    save_articles(articles, {})
+    return len(articles)
 
 
 # ==============================================================================
 # MAIN ENTRY POINT
 # ==============================================================================
 
-def main():
+def create_feed_session() -> requests.Session:
     """
-    Main entry point for Agent_News.
+    Create the pooled, retrying session shared by all feed fetches.
     
-    Orchestrates the news ingestion pipeline:
-    1. Load existing articles for deduplication
-    2. Fetch each registered source
-    3. Clean and standardize articles
-    4. Deduplicate across sources and runs
-    5. Save to output file
+    Returns:
+        Configured requests.Session with keep-alive pooling and retries
     """
-    print("=" * 70)
-    print("📰 AGENT_NEWS: Independence-Aware News Ingestion Engine")
-    print("   Project Sentinel - Multi-Source News Aggregation")
-    print("=" * 70)
+    session = requests.Session()
+    
+    # Short backoff: a feed that keeps failing is skipped, not waited on
+    retry_strategy = Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
     
-    print(f"\n📋 Source Registry: {len(SOURCE_CONFIG)} sources configured")
-    for source_id, config in SOURCE_CONFIG.items():
-        print(f"   └─ {source_id}: Tier {config['tier']}, {config['type']}")
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        max_retries=retry_strategy,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     
-    # Load existing articles for cross-run deduplication
-    existing_articles, existing_ids = load_existing_articles(OUTPUT_FILE)
-    initial_count = len(existing_articles)
-    print(f"\n📂 Loaded {initial_count} existing articles from cache")
+    return session
+
+
+def fetch_all_feeds(
+    feed_cache: Dict[str, Dict[str, Optional[str]]]
+) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """
+    Fetch every registered source concurrently over one shared session.
     
-    # Fetch all sources
-    print(f"\n🔄 Fetching feeds...")
+    Args:
+        feed_cache: Per-source conditional GET validators (updated in place)
+        
+    Returns:
+        Tuple of (fetched articles, failed source IDs, unchanged source IDs)
+    """
     all_new_articles = []
     failed_sources = []
+    unchanged_sources = []
+    
+    # Feeds are independent network I/O, so fetch them all concurrently;
+    # wall time becomes roughly the slowest feed instead of the sum
+    with create_feed_session() as session:
+        with ThreadPoolExecutor(max_workers=len(SOURCE_CONFIG)) as executor:
+            futures = {
+                executor.submit(fetch_feed, session, source_id, config, feed_cache): source_id
+                for source_id, config in SOURCE_CONFIG.items()
+            }
+            for future in as_completed(futures):
+                articles = future.result()
+                if articles is None:
+                    unchanged_sources.append(futures[future])
+                elif articles:
+                    all_new_articles.extend(articles)
+                else:
+                    failed_sources.append(futures[future])
+    
+    return all_new_articles, failed_sources, unchanged_sources
+
+
+def archive_articles(
+    fetched: Tuple[List[Dict[str, Any]], List[str], List[str]],
+    feed_cache: Dict[str, Dict[str, Optional[str]]]
+) -> None:
+    """
+    Deduplicate a fetch result against the archive, append it and report.
     
-    for source_id, config in SOURCE_CONFIG.items():
-        articles = fetch_feed(source_id, config)
-        if articles:
-            all_new_articles.extend(articles)
-        else:
-            failed_sources.append(source_id)
+    Args:
+        fetched: Result of fetch_all_feeds()
+        feed_cache: Validators to persist once the articles are saved
+    """
+    all_new_articles, failed_sources, unchanged_sources = fetched
+    
+    # One-time migration from the legacy single-document archive
+    migrated = migrate_legacy_archive()
+    if migrated:
+        print(f"   📦 Migrated {migrated} articles from {LEGACY_FILE.name}")
+    
+    # Load existing article IDs for cross-run deduplication
+    existing_ids = load_existing_ids(IDS_FILE, OUTPUT_FILE)
+    metadata = load_metadata(META_FILE)
+    print(f"\n📂 Loaded {len(existing_ids)} existing article IDs from cache")
     
     # Deduplicate
     unique_articles, duplicates_skipped = deduplicate_articles(
@@ -439,13 +827,17 @@ def main():
         existing_ids
     )
     
-    # Merge with existing (newest first)
-    # Sort all articles by published date, newest first
-    merged = existing_articles + unique_articles
-    merged.sort(key=lambda x: x.get('published_utc', ''), reverse=True)
+    # The archive is append-only: only the new batch is sorted, newest first.
+    # Keys are extracted once up front and compared via a C-level itemgetter
+    decorated = [(a.get('published_utc', ''), a) for a in unique_articles]
+    decorated.sort(key=itemgetter(0), reverse=True)
+    unique_articles = [article for _, article in decorated]
     
     # Save results
-    save_articles(merged, OUTPUT_FILE)
+    metadata = save_articles(unique_articles, metadata)
+    
+    # Validators are saved after the articles so a failed run re-fetches
+    save_feed_cache(feed_cache, FEED_CACHE_FILE)
     
     # Print summary
     print("\n" + "=" * 70)
@@ -454,15 +846,45 @@ def main():
     print(f"   Sources fetched:        {len(SOURCE_CONFIG) - len(failed_sources)}/{len(SOURCE_CONFIG)}")
     if failed_sources:
         print(f"   Failed sources:         {', '.join(failed_sources)}")
+    if unchanged_sources:
+        print(f"   Unchanged (HTTP 304):   {', '.join(unchanged_sources)}")
     print(f"   New articles fetched:   {len(all_new_articles)}")
     print(f"   Duplicates skipped:     {duplicates_skipped}")
     print(f"   Unique new articles:    {len(unique_articles)}")
-    print(f"   Total in database:      {len(merged)}")
+    print(f"   Total in database:      {metadata['total_articles']}")
     print("=" * 70)
     
     # Required output format
     print(f"\n🎯 Fetched {len(unique_articles)} articles. Skipped {duplicates_skipped} duplicates.")
 
 
+def main():
+    """
+    Main entry point for Agent_News.
+    
+    Orchestrates the news ingestion pipeline:
+    1. Fetch all registered sources concurrently
+    2. Clean and standardize articles
+    3. Load existing article IDs for deduplication
+    4. Deduplicate across sources and runs
+    5. Append new articles to the archive
+    """
+    print("=" * 70)
+    print("📰 AGENT_NEWS: Independence-Aware News Ingestion Engine")
+    print("   Project Sentinel - Multi-Source News Aggregation")
+    print("=" * 70)
+    
+    print(f"\n📋 Source Registry: {len(SOURCE_CONFIG)} sources configured")
+    for source_id, config in SOURCE_CONFIG.items():
+        print(f"   └─ {source_id}: Tier {config['tier']}, {config['type']}")
+    
+    # Fetch all sources
+    print(f"\n🔄 Fetching feeds...")
+    feed_cache = load_feed_cache(FEED_CACHE_FILE)
+    fetched = fetch_all_feeds(feed_cache)
+    
+    archive_articles(fetched, feed_cache)
+
+
 if __name__ == "__main__":
     main()
@@ -20,7 +20,9 @@ Authentication:
 
 Session Persistence:
     The script generates an 'anon.session' file on first login. Subsequent
-    runs reuse this session, so the user only authenticates once.
+    runs reuse this session, so the user only authenticates once. The session
+    also caches resolved channel entities (id + access hash), so channel
+    usernames are only resolved over the network on the first run.
 
 Target Channels:
     Curated list of geopolitical intelligence channels focused on Middle East
@@ -29,10 +31,13 @@ Target Channels:
 Smart Filtering:
     - Skips media-only messages (no text content)
     - Skips short messages (<50 chars) to filter noise
-    - Adds priority: "high" for BREAKING/URGENT/CONFIRMED keywords
+    - Adds priority: "high" for BREAKING/URGENT/CONFIRMED keywords near the
+      start of the message
 
 Rate Limiting:
-    Random 2-5 second delays between channel requests to avoid FloodWait bans.
+    Channels are fetched concurrently, at most 2 at a time. Each fetch holds
+    its slot for a random 2-5 second cool-down afterwards, which keeps the
+    request rate bounded to avoid FloodWait bans.
 
 Author: Project Sentinel Team
 Created: 2026
@@ -40,14 +45,17 @@ Created: 2026
 """
 
 import asyncio
-import json
+import heapq
 import os
 import random
+import re
 import sys
 from datetime import datetime, timezone
+from operator import countOf, itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import orjson
 from dotenv import load_dotenv
 
 # Telethon imports
@@ -59,6 +67,7 @@ try:
         UsernameNotOccupiedError,
         UsernameInvalidError,
     )
+    from telethon.tl.functions.messages import GetHistoryRequest
     from telethon.tl.types import Message
 except ImportError:
     print("❌ ERROR: Telethon not installed.")
@@ -93,12 +102,27 @@ TARGET_CHANNELS = [
 # Scraping configuration
 MESSAGES_PER_CHANNEL = 30      # Number of recent messages to fetch
 MIN_MESSAGE_LENGTH = 50        # Skip messages shorter than this
-DELAY_MIN = 2                  # Minimum delay between channels (seconds)
-DELAY_MAX = 5                  # Maximum delay between channels (seconds)
+DELAY_MIN = 2                  # Minimum cool-down per channel fetch (seconds)
+DELAY_MAX = 5                  # Maximum cool-down per channel fetch (seconds)
+MAX_CONCURRENT_CHANNELS = 2    # Channels fetched at the same time
 
 # Priority keywords (case-insensitive)
 PRIORITY_KEYWORDS = ["BREAKING", "URGENT", "CONFIRMED", "DEVELOPING"]
 
+# All keywords as one case-insensitive alternation: a single scan per
+# message, stopping at the first hit, with no uppercased copy of the text
+_PRIORITY_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in PRIORITY_KEYWORDS),
+    re.IGNORECASE
+)
+
+# Priority keywords lead the message ("BREAKING: ..."), so only the
+# opening characters are scanned
+PRIORITY_SCAN_CHARS = 200
+
+# Message dates are written as second-precision UTC ISO 8601
+ISO_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
 # Output configuration
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "data"
 OUTPUT_FILE = OUTPUT_DIR / "telegram_feed.json"
@@ -110,7 +134,9 @@ OUTPUT_FILE = OUTPUT_DIR / "telegram_feed.json"
 
 def check_priority(text: str) -> str:
     """
-    Check if message contains priority keywords.
+    Check if the opening of a message contains priority keywords.
+    
+    Only the first PRIORITY_SCAN_CHARS characters are scanned.
     
     Args:
         text: Message text content
@@ -118,43 +144,52 @@ def check_priority(text: str) -> str:
     Returns:
         "high" if priority keywords found, "normal" otherwise
     """
-    text_upper = text.upper()
-    for keyword in PRIORITY_KEYWORDS:
-        if keyword in text_upper:
-            return "high"
-    return "normal"
+    return "high" if _PRIORITY_RE.search(text, 0, PRIORITY_SCAN_CHARS) else "normal"
 
 
-def format_message(message: Message, channel_username: str) -> Optional[Dict[str, Any]]:
+def format_message(
+    message: Message,
+    channel_username: str,
+    now_iso: str
+) -> Optional[Dict[str, Any]]:
     """
-    Format a Telethon message object into a clean dictionary.
+    Format a raw Telethon message object into a clean dictionary.
     
     Applies smart filtering:
-    - Skips messages without text (media-only)
+    - Skips messages without text (media-only, service messages)
     - Skips messages shorter than MIN_MESSAGE_LENGTH
     
     Args:
-        message: Telethon Message object
+        message: Message from a GetHistoryRequest result
         channel_username: Source channel username
+        now_iso: Fallback timestamp for messages without a date
         
     Returns:
         Formatted dict or None if message should be skipped
     """
-    # Skip media-only messages (no text)
-    if not message.text or not message.text.strip():
+    # Skip media-only and short messages before copying anything. Raw
+    # history results carry the plain text in .message; service messages
+    # have none at all. Stripping can only shorten the text, so the raw
+    # length is a safe first cut
+    raw_text = getattr(message, 'message', None)
+    if not raw_text or len(raw_text) < MIN_MESSAGE_LENGTH:
         return None
     
-    text = message.text.strip()
+    text = raw_text.strip()
     
     # Skip short messages (noise filter)
     if len(text) < MIN_MESSAGE_LENGTH:
         return None
     
     # Format timestamp to ISO 8601 UTC
-    if message.date:
-        date_str = message.date.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+    # (Telethon dates are already UTC; only convert when they are not)
+    date = message.date
+    if date:
+        if date.tzinfo is not timezone.utc:
+            date = date.astimezone(timezone.utc)
+        date_str = date.strftime(ISO_UTC_FORMAT)
     else:
-        date_str = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        date_str = now_iso
     
     # Check for priority keywords
     priority = check_priority(text)
@@ -174,60 +209,96 @@ def format_message(message: Message, channel_username: str) -> Optional[Dict[str
 
 async def fetch_channel_messages(
     client: TelegramClient, 
-    channel_username: str
+    channel_username: str,
+    semaphore: asyncio.Semaphore
 ) -> List[Dict[str, Any]]:
     """
     Fetch recent messages from a single Telegram channel.
     
+    Runs concurrently with the other channels. The semaphore bounds how many
+    fetches are in flight, and each one keeps its slot through a jittered
+    cool-down so the overall request rate stays bounded. Log lines are
+    buffered and printed together so channels never interleave.
+    
     Args:
         client: Authenticated TelegramClient
         channel_username: Channel username (without @)
+        semaphore: Shared limit on concurrent channel fetches
         
     Returns:
         List of formatted message dicts
     """
     messages = []
     
-    try:
-        # Get channel entity
-        entity = await client.get_entity(channel_username)
+    async with semaphore:
+        now_iso = datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT)
+        log = [f"   📢 @{channel_username}..."]
         
-        # Fetch recent messages
-        async for message in client.iter_messages(entity, limit=MESSAGES_PER_CHANNEL):
-            formatted = format_message(message, channel_username)
-            if formatted:
-                messages.append(formatted)
+        try:
+            # Resolve the channel to an input peer. get_input_entity checks
+            # the entity cache persisted in the .session file first, so only
+            # the first run pays a ResolveUsername round-trip (get_entity
+            # would resolve on every run and count against FloodWait)
+            entity = await client.get_input_entity(channel_username)
+            
+            # Fetch recent messages in one raw history request. Unlike
+            # iter_messages this skips building custom Message wrappers
+            # (sender/chat/forward lookups) for fields that are never used
+            history = await client(GetHistoryRequest(
+                peer=entity,
+                offset_id=0,
+                offset_date=None,
+                add_offset=0,
+                limit=MESSAGES_PER_CHANNEL,
+                max_id=0,
+                min_id=0,
+                hash=0,
+            ))
+            
+            for message in history.messages:
+                formatted = format_message(message, channel_username, now_iso)
+                if formatted:
+                    messages.append(formatted)
+            
+            # Count priority messages
+            high_priority = countOf(map(itemgetter("priority"), messages), "high")
+            log.append(f"      ✓ Fetched {len(messages)} messages ({high_priority} high priority)")
+            
+        except ChannelPrivateError:
+            log.append(f"      ⚠️  Channel is private or restricted")
+        except UsernameNotOccupiedError:
+            log.append(f"      ⚠️  Channel username not found")
+        except UsernameInvalidError:
+            log.append(f"      ⚠️  Invalid channel username")
+        except FloodWaitError as e:
+            print(f"   ❌ @{channel_username} FloodWait: Must wait {e.seconds} seconds")
+            log.append(f"      ❌ FloodWait: waited {e.seconds} seconds")
+            # Wait the required time if hit by rate limit (holding the slot)
+            await asyncio.sleep(e.seconds)
+        except Exception as e:
+            log.append(f"      ❌ Error: {type(e).__name__}: {e}")
         
-        # Count priority messages
-        high_priority = sum(1 for m in messages if m.get("priority") == "high")
-        print(f"      ✓ Fetched {len(messages)} messages ({high_priority} high priority)")
+        print("\n".join(log))
         
-    except ChannelPrivateError:
-        print(f"      ⚠️  Channel is private or restricted")
-    except UsernameNotOccupiedError:
-        print(f"      ⚠️  Channel username not found")
-    except UsernameInvalidError:
-        print(f"      ⚠️  Invalid channel username")
-    except FloodWaitError as e:
-        print(f"      ❌ FloodWait: Must wait {e.seconds} seconds")
-        # Wait the required time if hit by rate limit
-        await asyncio.sleep(e.seconds)
-    except Exception as e:
-        print(f"      ❌ Error: {type(e).__name__}: {e}")
+        # Cool-down before the slot is released to the next channel
+        await asyncio.sleep(random.uniform(DELAY_MIN, DELAY_MAX))
     
     return messages
 
 
-async def main():
+async def main(pretty: bool = False):
     """
     Main entry point for Agent_Telegram.
     
     Orchestrates the Telegram scraping pipeline:
     1. Validate credentials
     2. Connect and authenticate (first time requires phone verification)
-    3. Iterate through target channels
-    4. Fetch and filter messages
+    3. Fetch and filter messages from all target channels concurrently
+    4. Merge the per-channel results
     5. Save to output file
+    
+    Args:
+        pretty: If True, write indented JSON for human reading
     """
     print("=" * 70)
     print("📱 AGENT_TELEGRAM: MTProto Channel Scraper")
@@ -264,24 +335,20 @@ async def main():
         me = await client.get_me()
         print(f"   ✓ Authenticated as: {me.first_name} (@{me.username})")
         
-        # Fetch from all channels
+        # Fetch from all channels, a bounded number at a time
         print(f"\n🔄 Scraping channels...")
-        all_messages = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNELS)
+        results = await asyncio.gather(
+            *(fetch_channel_messages(client, channel, semaphore) for channel in TARGET_CHANNELS),
+            return_exceptions=True
+        )
+        channel_runs = [r for r in results if isinstance(r, list)]
         
-        for i, channel in enumerate(TARGET_CHANNELS):
-            print(f"   📢 @{channel}...")
-            
-            messages = await fetch_channel_messages(client, channel)
-            all_messages.extend(messages)
-            
-            # Random delay between channels (except for last one)
-            if i < len(TARGET_CHANNELS) - 1:
-                delay = random.uniform(DELAY_MIN, DELAY_MAX)
-                print(f"      ⏳ Waiting {delay:.1f}s before next channel...")
-                await asyncio.sleep(delay)
-        
-        # Sort by date (newest first)
-        all_messages.sort(key=lambda x: x.get('date', ''), reverse=True)
+        # Merge by date (newest first). History results list each channel
+        # newest-first already, so this is a K-way merge, not a full sort
+        all_messages = list(heapq.merge(
+            *channel_runs, key=lambda x: x.get('date', ''), reverse=True
+        ))
         
         # Save results
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -292,13 +359,19 @@ async def main():
                 "scraped_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
                 "channels": TARGET_CHANNELS,
                 "total_messages": len(all_messages),
-                "high_priority_count": sum(1 for m in all_messages if m.get("priority") == "high"),
+                "high_priority_count": countOf(map(itemgetter("priority"), all_messages), "high"),
             },
             "messages": all_messages,
         }
         
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Compact by default (the consumers are scripts); orjson writes
+        # UTF-8 bytes directly (non-ASCII text kept as-is). Written to a
+        # temp file and renamed over the target, so readers never see a
+        # half-written file if the run is interrupted
+        tmp_path = OUTPUT_FILE.with_suffix(OUTPUT_FILE.suffix + '.tmp')
+        option = orjson.OPT_INDENT_2 if pretty else None
+        tmp_path.write_bytes(orjson.dumps(output, option=option))
+        os.replace(tmp_path, OUTPUT_FILE)
         
         print(f"\n💾 Saved to {OUTPUT_FILE}")
         
@@ -320,4 +393,14 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Scrape Telegram OSINT channels")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON for human reading"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(main(pretty=args.pretty))
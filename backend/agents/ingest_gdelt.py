@@ -5,9 +5,10 @@ AGENT_KINETIC: GDELT 2.0 Data Ingestion Agent for Project Sentinel
 ==============================================================================
 
 Purpose:
-    Queries the GDELT 2.0 API for kinetic/conflict events in the Middle East
-    region (Lebanon, Israel, Syria), focusing on material conflict events
-    coded using the CAMEO (Conflict and Mediation Event Observations) taxonomy.
+    Downloads the GDELT 2.0 event exports (one file per 15 minutes) for
+    kinetic/conflict events in the Middle East region (Lebanon, Israel,
+    Syria), focusing on material conflict events coded using the CAMEO
+    (Conflict and Mediation Event Observations) taxonomy.
 
 CAMEO Filtering Logic:
     -------------------------------------------------------------------------
@@ -46,20 +47,31 @@ Created: 2024
 ==============================================================================
 """
 
+import io
 import json
 import os
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
     retry_if_exception_type
 )
+from urllib3.util.retry import Retry
 
 # ==============================================================================
 # CONFIGURATION CONSTANTS
@@ -76,14 +88,44 @@ MATERIAL_CONFLICT_CODES = [
     "195",  # Employ aerial weapons (bombing/airstrikes)
 ]
 
+# Integer form for filtering: EventCode is compared numerically, so the raw
+# column never has to be converted to Python strings
+MATERIAL_CONFLICT_CODES_INT = np.array(
+    [int(code) for code in MATERIAL_CONFLICT_CODES], dtype=np.int32
+)
+
+# Short descriptions for the per-code log breakdown
+CAMEO_DESCRIPTIONS = {
+    "190": "Conventional military force",
+    "191": "Blockade/restrict movement",
+    "192": "Occupy territory",
+    "193": "Small arms combat",
+    "194": "Artillery/tank combat (shelling)",
+    "195": "Aerial weapons (bombing)",
+}
+
+@dataclass(frozen=True)
+class BBox:
+    """
+    Immutable geographic bounding box (degrees).
+    
+    Fixed attributes instead of a dict: the bounds are resolved once per
+    filter call and cannot be mutated by callers.
+    """
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+
+
 # Geographic Bounding Box: Lebanon / Israel / Syria Region
 # These coordinates create a rectangle encompassing the target countries
-BOUNDING_BOX = {
-    "lat_min": 29.0,   # Southern boundary (Sinai region)
-    "lat_max": 37.5,   # Northern boundary (Northern Syria/Turkey border)
-    "lon_min": 33.0,   # Western boundary (Mediterranean coast)
-    "lon_max": 42.5,   # Eastern boundary (Iraq border)
-}
+BOUNDING_BOX = BBox(
+    lat_min=29.0,   # Southern boundary (Sinai region)
+    lat_max=37.5,   # Northern boundary (Northern Syria/Turkey border)
+    lon_min=33.0,   # Western boundary (Mediterranean coast)
+    lon_max=42.5,   # Eastern boundary (Iraq border)
+)
 
 # Time window for event retrieval
 HOURS_LOOKBACK = 24
@@ -92,11 +134,190 @@ HOURS_LOOKBACK = 24
 OUTPUT_DIR = Path(__file__).parent.parent.parent / "data"
 OUTPUT_FILE = OUTPUT_DIR / "kinetic_events.json"
 
+# GDELT 2.0 raw event exports: one zipped TSV per 15-minute interval
+GDELT_BASE_URL = "http://data.gdeltproject.org/gdeltv2"
+GDELT_INTERVAL_MINUTES = 15
+GDELT_MAX_WORKERS = 8     # Parallel downloads (and pooled connections)
+REQUEST_TIMEOUT = 30      # seconds
+GDELT_PARSE_WORKERS = os.cpu_count() or 1   # Processes parsing/filtering files
+
+# Column layout of the GDELT 2.0 event export (61 columns, no header row)
+GDELT_EVENT_COLUMNS = [
+    "GLOBALEVENTID", "SQLDATE", "MonthYear", "Year", "FractionDate",
+    "Actor1Code", "Actor1Name", "Actor1CountryCode", "Actor1KnownGroupCode",
+    "Actor1EthnicCode", "Actor1Religion1Code", "Actor1Religion2Code",
+    "Actor1Type1Code", "Actor1Type2Code", "Actor1Type3Code",
+    "Actor2Code", "Actor2Name", "Actor2CountryCode", "Actor2KnownGroupCode",
+    "Actor2EthnicCode", "Actor2Religion1Code", "Actor2Religion2Code",
+    "Actor2Type1Code", "Actor2Type2Code", "Actor2Type3Code",
+    "IsRootEvent", "EventCode", "EventBaseCode", "EventRootCode", "QuadClass",
+    "GoldsteinScale", "NumMentions", "NumSources", "NumArticles", "AvgTone",
+    "Actor1Geo_Type", "Actor1Geo_FullName", "Actor1Geo_CountryCode",
+    "Actor1Geo_ADM1Code", "Actor1Geo_ADM2Code", "Actor1Geo_Lat",
+    "Actor1Geo_Long", "Actor1Geo_FeatureID",
+    "Actor2Geo_Type", "Actor2Geo_FullName", "Actor2Geo_CountryCode",
+    "Actor2Geo_ADM1Code", "Actor2Geo_ADM2Code", "Actor2Geo_Lat",
+    "Actor2Geo_Long", "Actor2Geo_FeatureID",
+    "ActionGeo_Type", "ActionGeo_FullName", "ActionGeo_CountryCode",
+    "ActionGeo_ADM1Code", "ActionGeo_ADM2Code", "ActionGeo_Lat",
+    "ActionGeo_Long", "ActionGeo_FeatureID",
+    "DATEADDED", "SOURCEURL",
+]
+
+# Only the columns the pipeline reads are parsed - the other 52 are skipped
+# by the CSV reader instead of being allocated and type-inferred
+GDELT_USECOLS = [
+    "SQLDATE", "Actor1Code", "Actor2Code", "EventCode", "GoldsteinScale",
+    "NumMentions", "ActionGeo_Lat", "ActionGeo_Long", "SOURCEURL",
+]
+
+# Explicit Arrow types skip inference. Actor codes repeat heavily (a few
+# hundred distinct values), so they are dictionary-encoded. Coordinates stay
+# float64 so the exported lat/lon keep their published decimals
+GDELT_COLUMN_TYPES = {
+    "SQLDATE": pa.int32(),
+    "Actor1Code": pa.dictionary(pa.int32(), pa.string()),
+    "Actor2Code": pa.dictionary(pa.int32(), pa.string()),
+    "EventCode": pa.int32(),
+    "GoldsteinScale": pa.float64(),
+    "NumMentions": pa.int32(),
+    "ActionGeo_Lat": pa.float64(),
+    "ActionGeo_Long": pa.float64(),
+    "SOURCEURL": pa.string(),
+}
+
 
 # ==============================================================================
 # RETRY DECORATOR FOR NETWORK RESILIENCE
 # ==============================================================================
 
+def gdelt_export_urls(start: datetime, end: datetime) -> List[str]:
+    """
+    List the GDELT 2.0 event export files covering a time window.
+    
+    GDELT publishes one export file per 15-minute interval, named after the
+    interval's timestamp (e.g. 20240115143000.export.CSV.zip).
+    
+    Args:
+        start: Window start (UTC)
+        end: Window end (UTC)
+    
+    Returns:
+        Export file URLs, oldest first
+    """
+    # Align to the 15-minute publication grid
+    slot = start.replace(second=0, microsecond=0)
+    slot -= timedelta(minutes=slot.minute % GDELT_INTERVAL_MINUTES)
+    
+    urls = []
+    while slot <= end:
+        urls.append(f"{GDELT_BASE_URL}/{slot.strftime('%Y%m%d%H%M%S')}.export.CSV.zip")
+        slot += timedelta(minutes=GDELT_INTERVAL_MINUTES)
+    return urls
+
+
+def create_gdelt_session() -> requests.Session:
+    """
+    Create a keep-alive session for downloading GDELT export files.
+    
+    All files live on one host, so a pooled connection per worker skips the
+    TCP handshake for every file after the first.
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=GDELT_MAX_WORKERS,
+        pool_maxsize=GDELT_MAX_WORKERS,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def download_export(session: requests.Session, url: str) -> Optional[bytes]:
+    """
+    Download a single zipped GDELT export file.
+    
+    Args:
+        session: Shared keep-alive session
+        url: Export file URL
+    
+    Returns:
+        Zipped file contents, or None if the file is not published
+    
+    Raises:
+        requests.RequestException: On network failures
+    """
+    response = session.get(url, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 404:
+        # Interval not published (yet) - GDELT occasionally skips one
+        return None
+    response.raise_for_status()
+    return response.content
+
+
+def parse_export(content: bytes) -> pd.DataFrame:
+    """
+    Decompress and parse a single GDELT export file.
+    
+    Args:
+        content: Zipped export file contents
+    
+    Returns:
+        DataFrame of the file's events (GDELT_USECOLS only)
+    """
+    # Each archive holds a single tab-separated file without a header row.
+    # Arrow's C++ reader parses it into columnar buffers that pandas wraps
+    # without copying (ArrowDtype columns). Files are parsed in separate
+    # processes, so Arrow's own reader threads are switched off
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        with archive.open(archive.namelist()[0]) as f:
+            table = pacsv.read_csv(
+                f,
+                read_options=pacsv.ReadOptions(
+                    column_names=GDELT_EVENT_COLUMNS,
+                    use_threads=False,
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter='\t',
+                    quote_char=False,                     # GDELT fields are never quoted
+                    invalid_row_handler=lambda row: 'skip',
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=GDELT_USECOLS,
+                    column_types=GDELT_COLUMN_TYPES,
+                    strings_can_be_null=True,
+                ),
+            )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def parse_and_filter_export(content: bytes) -> Tuple[pd.DataFrame, int, int]:
+    """
+    Parse one export file and keep only the events that pass the filters.
+    
+    Runs in a worker process: only the small filtered frame is sent back
+    to the parent, not the full 15-minute table.
+    
+    Args:
+        content: Zipped export file contents
+    
+    Returns:
+        Tuple of (filtered DataFrame, raw event count, CAMEO match count)
+    """
+    df = parse_export(content)
+    filtered, cameo_count = filter_events(df)
+    return filtered, len(df), cameo_count
+
+
 @retry(
     stop=stop_after_attempt(3),                    # Max 3 attempts
     wait=wait_exponential(multiplier=1, max=10),   # Exponential backoff: 1s, 2s, 4s...
@@ -110,171 +331,190 @@ OUTPUT_FILE = OUTPUT_DIR / "kinetic_events.json"
         f"(Attempt {retry_state.attempt_number}/3)"
     )
 )
-def fetch_gdelt_events(start_date: str, end_date: str) -> pd.DataFrame:
+def download_exports(urls: List[str]) -> Tuple[List[Tuple[pd.DataFrame, int, int]], int]:
     """
-    Fetch GDELT 2.0 events using the gdeltPyR library with retry logic.
+    Download GDELT export files in parallel and filter them across processes.
     
-    The gdeltPyR library provides a Pythonic interface to GDELT's massive
-    event database. It returns data as a pandas DataFrame for easy manipulation.
+    Downloads share one connection pool in a thread pool. As each file
+    arrives, its bytes are handed to a process pool that parses and filters
+    it, so decompression and CSV parsing use every core.
     
     Args:
-        start_date: Start date in 'YYYY MM DD' format (space-separated)
-        end_date: End date in 'YYYY MM DD' format (space-separated)
+        urls: Export file URLs
     
     Returns:
-        pandas DataFrame containing raw GDELT event records
+        Tuple of (per-file parse_and_filter_export results in URL order,
+        count of failed files)
     
     Raises:
-        ConnectionError: If GDELT API is unreachable after retries
-        ValueError: If date format is invalid
+        ConnectionError: If every file failed
     """
-    try:
-        # Import here to allow graceful failure if package not installed
-        from gdelt import gdelt
-    except ImportError:
-        print("❌ ERROR: gdeltPyR package not installed.")
-        print("   Run: pip install gdelt")
-        sys.exit(1)
-    
-    print(f"📡 Querying GDELT 2.0 API...")
-    print(f"   Date range: {start_date} to {end_date}")
+    results: List[Optional[Tuple[pd.DataFrame, int, int]]] = [None] * len(urls)
+    failed = 0
+    
+    def skip(index: int, error: Exception) -> None:
+        nonlocal failed
+        failed += 1
+        print(f"  ⚠️  Skipping {urls[index].rsplit('/', 1)[-1]}: {type(error).__name__}")
+    
+    with create_gdelt_session() as session, \
+            ThreadPoolExecutor(max_workers=GDELT_MAX_WORKERS) as downloads, \
+            ProcessPoolExecutor(max_workers=GDELT_PARSE_WORKERS) as parsers:
+        pending = {
+            downloads.submit(download_export, session, url): i
+            for i, url in enumerate(urls)
+        }
+        parsing = {}
+        for future in as_completed(pending):
+            try:
+                content = future.result()
+            except requests.exceptions.RequestException as e:
+                skip(pending[future], e)
+                continue
+            if content is not None:
+                parsing[parsers.submit(parse_and_filter_export, content)] = pending[future]
+        
+        for future in as_completed(parsing):
+            try:
+                results[parsing[future]] = future.result()
+            except (zipfile.BadZipFile, ValueError) as e:
+                skip(parsing[future], e)
     
-    # Initialize GDELT client for version 2.0 (more recent/real-time data)
-    gd = gdelt(version=2)
+    if urls and failed == len(urls):
+        raise ConnectionError("All GDELT export downloads failed")
     
-    try:
-        # Query the Events table
-        # GDELT 2.0 updates every 15 minutes with global news events
-        events = gd.Search(
-            date=[start_date, end_date],
-            table='events',        # Event-level data (vs mentions or GKG)
-            coverage=True,         # Include unique source URLs
-            output='df'            # Return as pandas DataFrame
-        )
-    except Exception as e:
-        error_msg = str(e).lower()
-        # Handle case where GDELT doesn't have data for requested dates
-        # (common with very recent or future dates)
-        if 'date' in error_msg and ('greater' in error_msg or 'future' in error_msg):
-            print(f"  ⚠️  GDELT data not available for requested dates.")
-            print(f"      Falling back to most recent available data...")
-            
-            # Try last 7 days as fallback (GDELT usually has 24-48 hour lag)
-            fallback_end = datetime(2025, 1, 15)  # Known working date
-            fallback_start = fallback_end - timedelta(days=1)
-            
-            events = gd.Search(
-                date=[fallback_start.strftime('%Y %m %d'), 
-                      fallback_end.strftime('%Y %m %d')],
-                table='events',
-                coverage=True,
-                output='df'
-            )
-            print(f"      Using fallback date range: {fallback_start.date()} to {fallback_end.date()}")
-        else:
-            raise
-    
-    print(f"   Retrieved {len(events)} raw events from GDELT")
-    return events
+    return [result for result in results if result is not None], failed
 
 
-def filter_by_cameo_codes(df: pd.DataFrame) -> pd.DataFrame:
+def fetch_gdelt_events(start: datetime, end: datetime) -> Tuple[pd.DataFrame, int, int]:
     """
-    Filter GDELT events to only include Material Conflict events.
+    Fetch and filter GDELT 2.0 events for a time window from the export files.
     
-    CAMEO (Conflict and Mediation Event Observations) is a standardized
-    coding scheme used by GDELT. The EventCode column contains the primary
-    CAMEO code for each event.
-    
-    Material Conflict codes (190-195) under root code 19 ("Fight") represent
-    actual physical/kinetic military actions, as opposed to:
-    - Root codes 01-05: Verbal cooperation
-    - Root codes 06-09: Material cooperation  
-    - Root codes 10-15: Verbal conflict
+    Each 15-minute export file in the window is downloaded concurrently
+    through a shared keep-alive connection pool, then decompressed, parsed
+    and filtered in a worker process. Only the filtered events are combined.
     
     Args:
-        df: Raw GDELT DataFrame
+        start: Window start (UTC)
+        end: Window end (UTC)
     
     Returns:
-        Filtered DataFrame containing only specified CAMEO codes
+        Tuple of (filtered events DataFrame, raw event count, CAMEO match count)
+    
+    Raises:
+        ConnectionError: If GDELT is unreachable after retries
     """
-    if df.empty or 'EventCode' not in df.columns:
-        print("  ⚠️  No EventCode column found or empty dataset")
-        return pd.DataFrame()
+    print(f"📡 Querying GDELT 2.0 event exports...")
+    print(f"   Date range: {start.strftime('%Y-%m-%d %H:%M')} to {end.strftime('%Y-%m-%d %H:%M')} UTC")
     
-    # Convert EventCode to string for reliable comparison
-    # GDELT sometimes returns codes as integers
-    df['EventCode'] = df['EventCode'].astype(str)
+    urls = gdelt_export_urls(start, end)
+    results, failed = download_exports(urls)
     
-    # Filter for our target CAMEO codes
-    filtered = df[df['EventCode'].isin(MATERIAL_CONFLICT_CODES)]
+    if not results:
+        # Handle case where GDELT doesn't have data for requested dates
+        # (common with very recent or future dates)
+        print(f"  ⚠️  GDELT data not available for requested dates.")
+        print(f"      Falling back to most recent available data...")
+        
+        fallback_end = datetime(2025, 1, 15)  # Known working date
+        fallback_start = fallback_end - timedelta(days=1)
+        
+        urls = gdelt_export_urls(fallback_start, fallback_end)
+        results, failed = download_exports(urls)
+        print(f"      Using fallback date range: {fallback_start.date()} to {fallback_end.date()}")
     
-    print(f"🎯 CAMEO Filter: {len(filtered)} events match codes {MATERIAL_CONFLICT_CODES}")
+    print(f"   Downloaded {len(results)}/{len(urls)} export files"
+          + (f" ({failed} failed)" if failed else ""))
     
-    # Log breakdown by code for transparency
-    if not filtered.empty:
-        code_counts = filtered['EventCode'].value_counts()
-        for code, count in code_counts.items():
-            code_desc = {
-                "190": "Conventional military force",
-                "191": "Blockade/restrict movement",
-                "192": "Occupy territory",
-                "193": "Small arms combat",
-                "194": "Artillery/tank combat (shelling)",
-                "195": "Aerial weapons (bombing)",
-            }.get(code, "Unknown")
-            print(f"     └─ Code {code}: {count} events ({code_desc})")
+    if not results:
+        return pd.DataFrame(), 0, 0
     
-    return filtered
+    frames, raw_counts, cameo_counts = zip(*results)
+    events = pd.concat(frames, ignore_index=True)
+    raw_count = sum(raw_counts)
+    print(f"   Retrieved {raw_count} raw events from GDELT")
+    return events, raw_count, sum(cameo_counts)
 
 
-def filter_by_bounding_box(df: pd.DataFrame) -> pd.DataFrame:
+def filter_events(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
     """
-    Filter events to only those within the Middle East bounding box.
+    Filter GDELT events to Material Conflict events inside the bounding box.
+    
+    CAMEO (Conflict and Mediation Event Observations) is a standardized
+    coding scheme used by GDELT. The EventCode column contains the primary
+    CAMEO code for each event.
+    
+    Material Conflict codes (190-195) under root code 19 ("Fight") represent
+    actual physical/kinetic military actions, as opposed to:
+    - Root codes 01-05: Verbal cooperation
+    - Root codes 06-09: Material cooperation  
+    - Root codes 10-15: Verbal conflict
     
     GDELT provides ActionGeo_Lat and ActionGeo_Long columns indicating
     the geographic location where the event occurred (as opposed to where
-    it was reported).
-    
-    Our bounding box covers:
+    it was reported). Our bounding box covers:
     - Lebanon: ~33.0-34.6°N, 35.1-36.6°E
     - Israel: ~29.5-33.3°N, 34.3-35.9°E  
     - Syria: ~32.3-37.3°N, 35.7-42.4°E
     
+    The code, coordinate and missing-value checks are combined into one
+    boolean mask, so the table is copied once instead of once per filter.
+    Runs once per export file in the worker processes, so it does not log;
+    see report_filter().
+    
     Args:
-        df: CAMEO-filtered GDELT DataFrame
+        df: Raw GDELT DataFrame
     
     Returns:
-        Geographically filtered DataFrame
+        Tuple of (filtered DataFrame, count of events matching the CAMEO codes)
     """
-    if df.empty:
-        return df
-    
-    # Check for required geo columns
+    if df.empty or 'EventCode' not in df.columns:
+        return pd.DataFrame(), 0
+    
+    # Compare codes as integers - GDELT returns them as integers or
+    # numeric strings, and both coerce in one vectorized pass
+    codes = pd.to_numeric(df['EventCode'], errors='coerce').astype('Int32')
+    cameo_mask = codes.isin(MATERIAL_CONFLICT_CODES_INT).to_numpy(dtype=bool)
+    cameo_count = int(cameo_mask.sum())
+    
+    # Apply bounding box filter on the same mask. Missing coordinates
+    # count as outside the box, so those events drop out as well
+    box = BOUNDING_BOX
+    lat_min, lat_max, lon_min, lon_max = box.lat_min, box.lat_max, box.lon_min, box.lon_max
     geo_cols = ['ActionGeo_Lat', 'ActionGeo_Long']
-    if not all(col in df.columns for col in geo_cols):
-        print("  ⚠️  Missing geographic columns, cannot filter by location")
-        return df
-    
-    # Remove events without valid coordinates
-    df = df.dropna(subset=geo_cols)
-    
-    # Apply bounding box filter
-    # Uses vectorized pandas operations for efficiency
-    mask = (
-        (df['ActionGeo_Lat'] >= BOUNDING_BOX['lat_min']) &
-        (df['ActionGeo_Lat'] <= BOUNDING_BOX['lat_max']) &
-        (df['ActionGeo_Long'] >= BOUNDING_BOX['lon_min']) &
-        (df['ActionGeo_Long'] <= BOUNDING_BOX['lon_max'])
-    )
+    if all(col in df.columns for col in geo_cols):
+        mask = (
+            cameo_mask &
+            df['ActionGeo_Lat'].between(lat_min, lat_max).to_numpy(dtype=bool, na_value=False) &
+            df['ActionGeo_Long'].between(lon_min, lon_max).to_numpy(dtype=bool, na_value=False)
+        )
+    else:
+        mask = cameo_mask
     
-    filtered = df[mask]
+    # Only the (small) matching subset gets the string form used downstream
+    filtered = df.loc[mask].assign(EventCode=codes[mask].astype(str)).reset_index(drop=True)
+    return filtered, cameo_count
+
+
+def report_filter(filtered: pd.DataFrame, cameo_count: int) -> None:
+    """
+    Print the CAMEO and bounding box filter results.
     
+    Args:
+        filtered: Events that passed both filters
+        cameo_count: Count of events matching the CAMEO codes
+    """
+    box = BOUNDING_BOX
+    print(f"🎯 CAMEO Filter: {cameo_count} events match codes {MATERIAL_CONFLICT_CODES}")
     print(f"🗺️  Geo Filter: {len(filtered)} events within bounding box")
-    print(f"     └─ Box: Lat {BOUNDING_BOX['lat_min']}-{BOUNDING_BOX['lat_max']}°, "
-          f"Lon {BOUNDING_BOX['lon_min']}-{BOUNDING_BOX['lon_max']}°")
+    print(f"     └─ Box: Lat {box.lat_min}-{box.lat_max}°, Lon {box.lon_min}-{box.lon_max}°")
     
-    return filtered
+    # Log breakdown by code for transparency
+    if not filtered.empty:
+        code_counts = filtered['EventCode'].value_counts()
+        for code, count in code_counts.items():
+            code_desc = CAMEO_DESCRIPTIONS.get(code, "Unknown")
+            print(f"     └─ Code {code}: {count} events ({code_desc})")
 
 
 def clean_and_transform(df: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -301,80 +541,100 @@ def clean_and_transform(df: pd.DataFrame) -> List[Dict[str, Any]]:
         print("📋 No events to transform")
         return []
     
-    events = []
-    
-    for _, row in df.iterrows():
-        try:
-            # Parse GDELT date format (YYYYMMDD integer) to ISO 8601
-            # GDELT stores dates as integers like 20240115
-            date_str = str(int(row.get('SQLDATE', 0)))
-            if len(date_str) == 8:
-                timestamp = datetime.strptime(date_str, '%Y%m%d').isoformat() + 'Z'
-            else:
-                timestamp = datetime.utcnow().isoformat() + 'Z'
-            
-            # Build clean event object
-            event = {
-                "timestamp": timestamp,
-                "lat": float(row.get('ActionGeo_Lat', 0)),
-                "lon": float(row.get('ActionGeo_Long', 0)),
-                "source_url": str(row.get('SOURCEURL', '')),
-                "event_code": str(row.get('EventCode', '')),
-                # Actor1 = Initiator/Attacker, Actor2 = Target/Recipient
-                "actor_1": str(row.get('Actor1Code', 'UNKNOWN')),
-                "actor_2": str(row.get('Actor2Code', 'UNKNOWN')),
-            }
-            
-            # Optional: Add additional context if available
-            if 'GoldsteinScale' in row:
-                # Goldstein Scale: -10 (conflict) to +10 (cooperation)
-                # Material conflict events are typically -6 to -10
-                event['goldstein_scale'] = float(row.get('GoldsteinScale', 0))
-            
-            if 'NumMentions' in row:
-                # Number of times this event was mentioned across sources
-                event['num_mentions'] = int(row.get('NumMentions', 1))
-            
-            events.append(event)
-            
-        except (ValueError, TypeError) as e:
-            # Skip malformed records but continue processing
-            print(f"  ⚠️  Skipping malformed record: {e}")
-            continue
+    def column(name: str, default: Any) -> pd.Series:
+        # Missing columns behave like a column filled with the default
+        if name in df.columns:
+            return df[name]
+        return pd.Series(default, index=df.index)
+    
+    # Parse GDELT date format (YYYYMMDD integer) to ISO 8601
+    # GDELT stores dates as integers like 20240115; anything else falls
+    # back to the current time. A lookback window spans only a few distinct
+    # dates, so each one is parsed and formatted once and then broadcast
+    sqldate = pd.to_numeric(column('SQLDATE', 0), errors='coerce').astype('Int64')
+    date_codes, unique_dates = pd.factorize(sqldate)
+    formatted = pd.to_datetime(
+        pd.Series(unique_dates, dtype='Int64').astype(str), format='%Y%m%d', errors='coerce'
+    ).dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+    fallback = datetime.utcnow().isoformat() + 'Z'
+    # Missing dates have code -1, which selects the trailing fallback entry
+    lookup = np.append(formatted.fillna(fallback).to_numpy(dtype=object), fallback)
+    timestamps = pd.Series(lookup[date_codes], index=df.index)
+    
+    # Build all output columns at once instead of boxing every cell per row
+    columns = {
+        "timestamp": timestamps,
+        "lat": pd.to_numeric(column('ActionGeo_Lat', 0.0), errors='coerce').fillna(0.0),
+        "lon": pd.to_numeric(column('ActionGeo_Long', 0.0), errors='coerce').fillna(0.0),
+        "source_url": column('SOURCEURL', '').fillna('').astype(str),
+        "event_code": column('EventCode', '').astype(str),
+        # Actor1 = Initiator/Attacker, Actor2 = Target/Recipient
+        "actor_1": column('Actor1Code', 'UNKNOWN').astype(object).fillna('UNKNOWN').astype(str),
+        "actor_2": column('Actor2Code', 'UNKNOWN').astype(object).fillna('UNKNOWN').astype(str),
+    }
+    
+    # Optional: Add additional context if available
+    if 'GoldsteinScale' in df.columns:
+        # Goldstein Scale: -10 (conflict) to +10 (cooperation)
+        # Material conflict events are typically -6 to -10
+        columns['goldstein_scale'] = pd.to_numeric(df['GoldsteinScale'], errors='coerce').fillna(0.0)
+    
+    if 'NumMentions' in df.columns:
+        # Number of times this event was mentioned across sources
+        columns['num_mentions'] = pd.to_numeric(df['NumMentions'], errors='coerce').fillna(1).astype(int)
+    
+    # Convert each column to Python values in bulk (tolist runs in C), then
+    # zip the columns into records - no intermediate DataFrame, no per-row
+    # indexing
+    keys = tuple(columns)
+    values = [series.tolist() for series in columns.values()]
+    events = [dict(zip(keys, row)) for row in zip(*values)]
     
     print(f"✅ Transformed {len(events)} events to clean JSON format")
     return events
 
 
-def save_events(events: List[Dict[str, Any]], filepath: Path) -> None:
+def save_events(events: List[Dict[str, Any]], filepath: Path, pretty: bool = False) -> None:
     """
     Save cleaned events to JSON file.
     
     Args:
         events: List of clean event dictionaries
         filepath: Output file path
+        pretty: If True, indent the JSON for human reading
     """
     # Ensure output directory exists
     filepath.parent.mkdir(parents=True, exist_ok=True)
     
-    # Write with pretty formatting for readability
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(events, f, indent=2, ensure_ascii=False)
+    # Compact by default: the consumers are the correlation and graph
+    # loading scripts, and indentation roughly doubles the file size.
+    # orjson emits UTF-8 bytes directly, without building the whole
+    # document as a str. Written to a temp file and renamed over the
+    # target, so readers never see a half-written file if the run is
+    # interrupted
+    tmp_path = filepath.with_suffix(filepath.suffix + '.tmp')
+    option = orjson.OPT_INDENT_2 if pretty else None
+    tmp_path.write_bytes(orjson.dumps(events, option=option))
+    os.replace(tmp_path, filepath)
     
     print(f"💾 Saved {len(events)} events to {filepath}")
 
 
-def main():
+def main(pretty: bool = False):
     """
     Main entry point for Agent_Kinetic.
     
     Orchestrates the full ingestion pipeline:
     1. Calculate date range (last 24 hours)
-    2. Fetch raw events from GDELT 2.0
-    3. Filter by CAMEO codes (Material Conflict)
-    4. Filter by geographic bounding box (Middle East)
-    5. Clean and transform to JSON format
-    6. Save to output file
+    2. Fetch the GDELT 2.0 15-minute exports, filtering each file by
+       CAMEO codes (Material Conflict) and geographic bounding box
+       (Middle East) in parallel worker processes
+    3. Report the filter results
+    4. Clean and transform to JSON format
+    5. Save to output file
+    
+    Args:
+        pretty: If True, write indented JSON for human reading
     """
     print("=" * 70)
     print("🎯 AGENT_KINETIC: GDELT 2.0 Material Conflict Ingestion")
@@ -385,42 +645,36 @@ def main():
     end_date = datetime.utcnow()
     start_date = end_date - timedelta(hours=HOURS_LOOKBACK)
     
-    # Format dates for GDELT API (space-separated: "YYYY MM DD")
-    start_str = start_date.strftime('%Y %m %d')
-    end_str = end_date.strftime('%Y %m %d')
-    
     print(f"\n⏰ Time Window: Last {HOURS_LOOKBACK} hours")
     print(f"   Start: {start_date.isoformat()}Z")
     print(f"   End:   {end_date.isoformat()}Z\n")
     
     try:
-        # Step 1: Fetch raw events from GDELT
-        raw_events = fetch_gdelt_events(start_str, end_str)
+        # Step 1: Fetch events from GDELT, filtered by CAMEO codes and
+        # geographic bounding box as each export file is parsed
+        geo_filtered, raw_count, cameo_count = fetch_gdelt_events(start_date, end_date)
         
-        if raw_events.empty:
+        if raw_count == 0:
             print("\n⚠️  No events returned from GDELT API")
             print("   This may indicate no recent events or API issues")
-            save_events([], OUTPUT_FILE)
+            save_events([], OUTPUT_FILE, pretty)
             return
         
-        # Step 2: Filter by CAMEO codes (Material Conflict)
-        cameo_filtered = filter_by_cameo_codes(raw_events)
+        # Step 2: Report the filter results
+        report_filter(geo_filtered, cameo_count)
         
-        # Step 3: Filter by geographic bounding box
-        geo_filtered = filter_by_bounding_box(cameo_filtered)
-        
-        # Step 4: Clean and transform to JSON
+        # Step 3: Clean and transform to JSON
         clean_events = clean_and_transform(geo_filtered)
         
-        # Step 5: Save to output file
-        save_events(clean_events, OUTPUT_FILE)
+        # Step 4: Save to output file
+        save_events(clean_events, OUTPUT_FILE, pretty)
         
         # Print summary
         print("\n" + "=" * 70)
         print("📊 INGESTION SUMMARY")
         print("=" * 70)
-        print(f"   Raw events from GDELT:     {len(raw_events):,}")
-        print(f"   After CAMEO filter:        {len(cameo_filtered):,}")
+        print(f"   Raw events from GDELT:     {raw_count:,}")
+        print(f"   After CAMEO filter:        {cameo_count:,}")
         print(f"   After geo filter:          {len(geo_filtered):,}")
         print(f"   Final clean events:        {len(clean_events):,}")
         print(f"   Output file:               {OUTPUT_FILE}")
@@ -438,4 +692,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Ingest GDELT material conflict events")
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON for human reading"
+    )
+    args = parser.parse_args()
+    
+    main(pretty=args.pretty)
@@ -41,11 +41,17 @@ Created: 2026
 ==============================================================================
 """
 
+import math
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Tuple
 
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
 try:
@@ -68,10 +74,26 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "sentinel_password")
 
+# Driver connection pool
+MAX_CONNECTION_POOL_SIZE = 50
+MAX_CONNECTION_LIFETIME = 3600  # seconds
+
 # Correlation parameters
 SPATIAL_RADIUS_KM = 50          # Max distance for flight correlation (km)
-TEMPORAL_WINDOW_HOURS = 1       # Time window for flight correlation (+/- hours)
 EVENT_LOOKBACK_HOURS = 24       # Only score events from last N hours
+EVENT_BATCH_SIZE = 500          # Events sent per UNWIND query
+BATCH_WORKERS = 8               # Batches written concurrently (own sessions)
+KM_PER_DEGREE_LAT = 111.0       # Length of one degree of latitude (km)
+
+# Radius Neo4j uses for geographic point.distance(), so the NumPy
+# cross-check measures distances the same way
+EARTH_RADIUS_KM = 6378.14
+
+# Flight snapshot written by Agent_Skywatcher (for --verify-flights)
+FLIGHTS_FILE = Path(__file__).parent.parent.parent / "data" / "flight_radar.json"
+
+# Timestamps are compared and written as second-precision UTC ISO 8601
+ISO_UTC_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 # Scoring weights
 SCORE_TIER1_SOURCE = 20         # Wire services (NPR, BBC)
@@ -91,26 +113,27 @@ STATUS_PLAUSIBLE = 60           # Below this (but >= 30) = Plausible
 # ==============================================================================
 
 # Maps grid locations to human-readable names for narrative linking
-# Grid format: Grid_LAT_LON (rounded to nearest integer)
+# Grid format: Grid_LAT_LON (rounded to nearest integer). Values are tuples
+# so the cached lookups below can be shared safely
 GRID_TO_LOCATION = {
     # Israel
-    "Grid_32_35": ["Israel", "Tel Aviv", "Jerusalem", "West Bank"],
-    "Grid_31_35": ["Israel", "Jerusalem", "Gaza"],
-    "Grid_32_34": ["Israel", "Tel Aviv"],
+    "Grid_32_35": ("Israel", "Tel Aviv", "Jerusalem", "West Bank"),
+    "Grid_31_35": ("Israel", "Jerusalem", "Gaza"),
+    "Grid_32_34": ("Israel", "Tel Aviv"),
     # Lebanon
-    "Grid_34_36": ["Lebanon", "Beirut"],
-    "Grid_33_36": ["Lebanon"],
-    "Grid_34_35": ["Lebanon", "Golan Heights"],
+    "Grid_34_36": ("Lebanon", "Beirut"),
+    "Grid_33_36": ("Lebanon",),
+    "Grid_34_35": ("Lebanon", "Golan Heights"),
     # Syria
-    "Grid_35_36": ["Syria", "Damascus"],
-    "Grid_35_37": ["Syria"],
-    "Grid_36_37": ["Syria", "Aleppo"],
-    "Grid_36_36": ["Syria", "Idlib"],
+    "Grid_35_36": ("Syria", "Damascus"),
+    "Grid_35_37": ("Syria",),
+    "Grid_36_37": ("Syria", "Aleppo"),
+    "Grid_36_36": ("Syria", "Idlib"),
     # Gaza
-    "Grid_31_34": ["Gaza", "Palestine"],
+    "Grid_31_34": ("Gaza", "Palestine"),
     # Jordan
-    "Grid_32_36": ["Jordan"],
-    "Grid_31_36": ["Jordan"],
+    "Grid_32_36": ("Jordan",),
+    "Grid_31_36": ("Jordan",),
 }
 
 
@@ -124,12 +147,20 @@ class CorrelationEngine:
     """
     
     def __init__(self, uri: str, user: str, password: str):
-        """Initialize Neo4j driver connection."""
+        """Initialize Neo4j driver connection and the shared session."""
         self.driver = None
+        self.session = None
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(user, password))
-            with self.driver.session() as session:
-                session.run("RETURN 1")
+            self.driver = GraphDatabase.driver(
+                uri,
+                auth=(user, password),
+                max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+                max_connection_lifetime=MAX_CONNECTION_LIFETIME,
+                keep_alive=True,
+            )
+            # One session for the whole run instead of one per query
+            self.session = self.driver.session()
+            self.session.run("RETURN 1").consume()
             print(f"   ✓ Connected to Neo4j at {uri}")
         except ServiceUnavailable:
             print(f"   ❌ Cannot connect to Neo4j at {uri}")
@@ -140,38 +171,87 @@ class CorrelationEngine:
             sys.exit(1)
     
     def close(self):
-        """Close the driver connection."""
+        """Close the shared session and the driver connection."""
+        if self.session:
+            self.session.close()
         if self.driver:
             self.driver.close()
     
     def run_query(self, query: str, parameters: Dict = None) -> List[Dict]:
         """Execute a Cypher query and return results as list of dicts."""
-        with self.driver.session() as session:
-            result = session.run(query, parameters or {})
+        result = self.session.run(query, parameters or {})
+        return [record.data() for record in result]
+    
+    def run_batch(
+        self,
+        query: str,
+        data: List[Dict],
+        parameters: Dict = None,
+        batch_size: int = EVENT_BATCH_SIZE
+    ) -> List[Dict]:
+        """
+        Execute an UNWIND $batch write query in batches and collect all results.
+        
+        Each batch runs as a managed write transaction, so the driver retries
+        it on transient errors (including deadlocks between batches). A single
+        batch uses the shared session; more are written concurrently, each
+        worker on its own pooled session, since sessions are not thread-safe.
+        """
+        batches = [data[i:i + batch_size] for i in range(0, len(data), batch_size)]
+        
+        def write_batch(tx, batch):
+            result = tx.run(query, {**(parameters or {}), "batch": batch})
             return [record.data() for record in result]
+        
+        def write_in_own_session(batch):
+            with self.driver.session() as session:
+                return session.execute_write(write_batch, batch)
+        
+        if not batches:
+            return []
+        if len(batches) == 1:
+            return self.session.execute_write(write_batch, batches[0])
+        
+        results = []
+        with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(batches))) as executor:
+            for rows in executor.map(write_in_own_session, batches):
+                results.extend(rows)
+        
+        return results
 
 
 # ==============================================================================
 # CORRELATION ALGORITHMS
 # ==============================================================================
 
-def get_recent_events(engine: CorrelationEngine, hours: int = 24) -> List[Dict]:
+def get_recent_events(engine: CorrelationEngine, now: datetime, hours: int = 24) -> List[Dict]:
     """
     Get all events from the last N hours.
     
+    Events without a timestamp are always included. They are fetched in
+    a separate UNION branch so the time-window branch can seek on the
+    event_ts range index (an OR across both predicates forces a scan).
+    
     Args:
         engine: CorrelationEngine instance
+        now: Start time of the run (UTC)
         hours: Lookback window in hours
         
     Returns:
         List of event records with id, timestamp, lat, lon, location
     """
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    cutoff_str = cutoff.isoformat().replace('+00:00', 'Z')
+    cutoff_str = (now - timedelta(hours=hours)).strftime(ISO_UTC_FORMAT)
     
     query = """
-    MATCH (e:Event)
-    WHERE e.timestamp >= $cutoff OR e.timestamp IS NULL
+    CALL {
+        MATCH (e:Event)
+        WHERE e.timestamp >= $cutoff
+        RETURN e
+        UNION
+        MATCH (e:Event)
+        WHERE e.timestamp IS NULL
+        RETURN e
+    }
     OPTIONAL MATCH (e)-[:OCCURRED_IN]->(loc:Location)
     RETURN 
         e.id AS id,
@@ -186,256 +266,386 @@ def get_recent_events(engine: CorrelationEngine, hours: int = 24) -> List[Dict]:
     return engine.run_query(query, {"cutoff": cutoff_str})
 
 
-def link_nearby_flights(engine: CorrelationEngine, event: Dict) -> Dict:
+def radius_bbox(lat: float, lon: float, radius_km: float) -> Tuple[float, float, float, float]:
     """
-    STEP A: Spatial Linking - Find flights within 50km and +/- 1 hour.
-    
-    Uses Neo4j's point.distance() for efficient spatial queries.
-    Creates (:Flight)-[:DETECTED_NEAR]->(:Event) relationships.
+    Compute a lat/lon box that contains a circle around a point.
     
     Args:
-        engine: CorrelationEngine instance
-        event: Event dict with id, lat, lon, timestamp
+        lat: Center latitude (degrees)
+        lon: Center longitude (degrees)
+        radius_km: Circle radius (km)
         
     Returns:
-        Dict with count of regular and military flights
+        Tuple of (lat_min, lat_max, lon_min, lon_max); longitudes may wrap
+        across the antimeridian (lon_min > lon_max)
     """
-    event_id = event.get('id')
-    lat = event.get('lat')
-    lon = event.get('lon')
-    
-    if not all([event_id, lat, lon]):
-        return {"total": 0, "military": 0}
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    lat_min = max(lat - dlat, -90.0)
+    lat_max = min(lat + dlat, 90.0)
     
-    # Find and link nearby flights using spatial distance
-    query = """
-    MATCH (e:Event {id: $event_id})
-    MATCH (f:Flight)
-    WHERE f.latitude IS NOT NULL AND f.longitude IS NOT NULL
-      AND point.distance(
-          point({latitude: e.lat, longitude: e.lon}),
-          point({latitude: f.latitude, longitude: f.longitude})
-      ) <= $radius_meters
-    MERGE (f)-[:DETECTED_NEAR]->(e)
-    RETURN 
-        count(f) AS total_flights,
-        sum(CASE WHEN f.tag = 'high_altitude_fast' THEN 1 ELSE 0 END) AS military_flights
-    """
-    
-    results = engine.run_query(query, {
-        "event_id": event_id,
-        "radius_meters": SPATIAL_RADIUS_KM * 1000  # Convert km to meters
-    })
+    # Meridians converge towards the poles; use the widest latitude in the box
+    cos_lat = math.cos(math.radians(max(abs(lat_min), abs(lat_max))))
+    if cos_lat * 180.0 * KM_PER_DEGREE_LAT <= radius_km:
+        return lat_min, lat_max, -180.0, 180.0
     
-    if results:
-        return {
-            "total": results[0].get("total_flights", 0),
-            "military": results[0].get("military_flights", 0)
-        }
-    return {"total": 0, "military": 0}
+    dlon = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    lon_min = (lon - dlon + 180.0) % 360.0 - 180.0
+    lon_max = (lon + dlon + 180.0) % 360.0 - 180.0
+    return lat_min, lat_max, lon_min, lon_max
 
 
-def get_location_keywords(grid_location: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def get_location_keywords(grid_location: str) -> Tuple[str, ...]:
     """
     Get location keywords for narrative linking based on grid location.
     
+    Cached: every event in the same grid cell shares the lookup. The
+    result is an immutable tuple, so callers cannot alter cached entries.
+    
     Args:
         grid_location: Grid cell name (e.g., "Grid_34_36")
         
     Returns:
-        List of location names to search for in text
+        Tuple of location names to search for in text
     """
     if not grid_location:
-        return []
+        return ()
     
     # Direct mapping
     if grid_location in GRID_TO_LOCATION:
         return GRID_TO_LOCATION[grid_location]
     
     # Fallback: extract lat/lon and find nearby mappings
-    return []
+    return ()
 
 
-def link_narrative_sources(engine: CorrelationEngine, event: Dict) -> Dict:
+def correlate_events(engine: CorrelationEngine, events: List[Dict], scored_at: str) -> List[Dict]:
     """
-    STEP B: Narrative Linking - Find articles/posts mentioning event location.
+    Link, score and classify events in one server-side pass.
+    
+    Each batch of events goes through a single UNWIND query that runs all
+    three steps on the database, so no intermediate counts travel back to
+    Python and a separate write-back round trip is not needed:
+    
+    STEP A - Spatial Linking: flights within SPATIAL_RADIUS_KM, via the
+        Flight.location point index. A lat/lon box around each event,
+        computed in Python, narrows the index seek before the exact
+        distance check. Creates (:Flight)-[:DETECTED_NEAR]->(:Event).
+    
+    STEP B - Narrative Linking: articles and posts that MENTION one of the
+        event's location keywords (resolved in Python). Creates
+        (:Article)-[:CORROBORATES]->(:Event) and
+        (:Post)-[:CORROBORATES]->(:Event).
+    
+    Links left on the events by earlier runs are deleted first and the new
+    ones are written with CREATE, stamped with created_at.
     
-    Creates:
-    - (:Article)-[:CORROBORATES]->(:Event)
-    - (:Post)-[:CORROBORATES]->(:Event)
+    STEP C - Scoring: tier and flight points (capped at 100) are summed
+        and the status classified in Cypher, then written to the event.
     
     Args:
         engine: CorrelationEngine instance
-        event: Event dict with id and grid_location
+        events: Event dicts with id, lat, lon and grid_location
+        scored_at: Timestamp of the scoring run, shared by all events
         
     Returns:
-        Dict with counts by source tier
+        One dict per scored event with id, score, status, up to three
+        source names and total/military flight counts
     """
-    event_id = event.get('id')
-    grid_location = event.get('grid_location')
-    
-    if not event_id:
-        return {"tier1": 0, "tier2": 0, "tier3": 0}
-    
-    # Get location keywords for this event
-    location_keywords = get_location_keywords(grid_location)
-    
-    if not location_keywords:
-        # Fallback: use any existing Location links
-        location_keywords = []
-    
-    # Link articles that mention relevant locations
-    article_query = """
-    MATCH (e:Event {id: $event_id})
-    MATCH (a:Article)-[:MENTIONS]->(loc:Location)
-    WHERE loc.name IN $locations
-    MERGE (a)-[:CORROBORATES]->(e)
-    WITH e, a
-    MATCH (s:Source)-[:PUBLISHED]->(a)
+    batch = []
+    for event in events:
+        if not event.get('id'):
+            continue
+        
+        record = {
+            "id": event['id'],
+            "locations": get_location_keywords(event.get('grid_location')),
+        }
+        # Events without coordinates get no box and match no flights
+        if all([event.get('lat'), event.get('lon')]):
+            lat_min, lat_max, lon_min, lon_max = radius_bbox(
+                event['lat'], event['lon'], SPATIAL_RADIUS_KM
+            )
+            record.update(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+        batch.append(record)
+    
+    # Each linking subquery aggregates, so it returns exactly one row per
+    # event even when nothing matches. Links from earlier runs are dropped
+    # first, so every pair is new and is written with CREATE (no
+    # existence check per pair as with MERGE)
+    query = """
+    UNWIND $batch AS ev
+    MATCH (e:Event {id: ev.id})
+    
+    CALL {
+        WITH e
+        OPTIONAL MATCH (e)<-[old:DETECTED_NEAR|CORROBORATES]-()
+        DELETE old
+    }
+    
+    // STEP A: Spatial linking
+    CALL {
+        WITH e, ev
+        MATCH (f:Flight)
+        WHERE point.withinBBox(
+              f.location,
+              point({latitude: ev.lat_min, longitude: ev.lon_min}),
+              point({latitude: ev.lat_max, longitude: ev.lon_max})
+          )
+          AND point.distance(f.location, e.location) <= $radius_meters
+        CREATE (f)-[:DETECTED_NEAR {created_at: $scored_at}]->(e)
+        RETURN 
+            count(f) AS total_flights,
+            count(CASE WHEN f.tag = 'high_altitude_fast' THEN 1 END) AS military_flights
+    }
+    
+    // STEP B: Narrative linking (articles, then Telegram posts)
+    CALL {
+        WITH e, ev
+        MATCH (a:Article)-[:MENTIONS]->(loc:Location)
+        WHERE loc.name IN ev.locations
+        WITH DISTINCT e, a
+        CREATE (a)-[:CORROBORATES {created_at: $scored_at}]->(e)
+        WITH a
+        MATCH (s:Source)-[:PUBLISHED]->(a)
+        WITH s.tier AS tier,
+             count(DISTINCT a) AS article_count,
+             collect(DISTINCT s.name)[..3] AS sources
+        RETURN collect({tier: tier, article_count: article_count, sources: sources}) AS tiers
+    }
+    CALL {
+        WITH e, ev
+        MATCH (p:Post)-[:MENTIONS]->(loc:Location)
+        WHERE loc.name IN ev.locations
+        WITH DISTINCT e, p
+        CREATE (p)-[:CORROBORATES {created_at: $scored_at}]->(e)
+        RETURN count(p) AS post_count
+    }
+    
+    // STEP C: Scoring. Articles from sources without tier 1/2 and all
+    // Telegram posts count as Tier 3
+    WITH e, ev, total_flights, military_flights, tiers,
+         any(t IN tiers WHERE t.tier = 1) AS has_tier1,
+         any(t IN tiers WHERE t.tier = 2) AS has_tier2,
+         reduce(n = post_count, t IN tiers |
+             n + CASE WHEN t.tier IN [1, 2] THEN 0 ELSE t.article_count END
+         ) AS tier3_count
+    WITH e, ev, total_flights, military_flights, tiers,
+         CASE WHEN has_tier1 THEN $score_tier1 ELSE 0 END
+         + CASE WHEN has_tier2 THEN $score_tier2 ELSE 0 END
+         + CASE WHEN tier3_count * $score_tier3 < $score_tier3_cap
+                THEN tier3_count * $score_tier3 ELSE $score_tier3_cap END
+         + CASE WHEN military_flights > 0 THEN $score_military ELSE 0 END AS raw_score
+    WITH e, ev, total_flights, military_flights, tiers,
+         CASE WHEN raw_score > 100 THEN 100 ELSE raw_score END AS score
+    SET e.confidence_score = score,
+        e.status = CASE
+            WHEN score < $status_unverified THEN 'Unverified'
+            WHEN score < $status_plausible THEN 'Plausible'
+            ELSE 'Confirmed'
+        END,
+        e.scored_at = $scored_at
     RETURN 
-        s.tier AS tier,
-        count(DISTINCT a) AS article_count,
-        collect(DISTINCT s.name) AS sources
+        ev.id AS id,
+        score,
+        e.status AS status,
+        reduce(all_sources = [], t IN tiers | all_sources + t.sources)[..3] AS sources,
+        total_flights,
+        military_flights
     """
     
-    article_results = engine.run_query(article_query, {
-        "event_id": event_id,
-        "locations": location_keywords
+    return engine.run_batch(query, batch, {
+        "radius_meters": SPATIAL_RADIUS_KM * 1000,  # Convert km to meters
+        "score_tier1": SCORE_TIER1_SOURCE,
+        "score_tier2": SCORE_TIER2_SOURCE,
+        "score_tier3": SCORE_TIER3_SOURCE,
+        "score_tier3_cap": SCORE_TIER3_CAP,
+        "score_military": SCORE_MILITARY_FLIGHT,
+        "status_unverified": STATUS_UNVERIFIED,
+        "status_plausible": STATUS_PLAUSIBLE,
+        "scored_at": scored_at,
     })
-    
-    # Link Telegram posts that mention relevant locations
-    post_query = """
-    MATCH (e:Event {id: $event_id})
-    MATCH (p:Post)
-    WHERE any(loc IN $locations WHERE toLower(p.text) CONTAINS toLower(loc))
-    MERGE (p)-[:CORROBORATES]->(e)
-    RETURN count(p) AS post_count
+
+
+def get_status_counts(engine: CorrelationEngine, scored_at: str) -> Dict[str, int]:
     """
+    Count the events of a scoring run by status, aggregated on the server.
     
-    post_results = engine.run_query(post_query, {
-        "event_id": event_id,
-        "locations": location_keywords
-    })
-    
-    # Aggregate by tier
-    tier_counts = {"tier1": 0, "tier2": 0, "tier3": 0, "sources": []}
-    
-    for row in article_results:
-        tier = row.get("tier", 3)
-        count = row.get("article_count", 0)
-        sources = row.get("sources", [])
-        
-        if tier == 1:
-            tier_counts["tier1"] += count
-        elif tier == 2:
-            tier_counts["tier2"] += count
-        else:
-            tier_counts["tier3"] += count
+    Args:
+        engine: CorrelationEngine instance
+        scored_at: Timestamp of the scoring run
         
-        tier_counts["sources"].extend(sources)
-    
-    # Telegram posts count as Tier 3
-    if post_results:
-        tier_counts["tier3"] += post_results[0].get("post_count", 0)
+    Returns:
+        Mapping of status to event count
+    """
+    query = """
+    MATCH (e:Event)
+    WHERE e.scored_at = $scored_at
+    RETURN e.status AS status, count(*) AS count
+    """
     
-    return tier_counts
+    rows = engine.run_query(query, {"scored_at": scored_at})
+    return {row['status']: row['count'] for row in rows}
 
 
-def calculate_score(flight_data: Dict, source_data: Dict) -> int:
+def get_top_events(engine: CorrelationEngine, scored_at: str, limit: int = 20) -> List[Dict]:
     """
-    STEP C: Calculate confidence score based on corroborating evidence.
+    Get the highest-scoring events of a scoring run.
+    
+    The location and the corroborating source names (up to three) are
+    read back from the OCCURRED_IN and CORROBORATES links.
     
-    Scoring:
-        +20 pts: Tier 1 source (wire services)
-        +10 pts: Tier 2 source (mainstream international)
-        +5 pts:  Tier 3 source (per source, capped at 30)
-        +40 pts: Military flight nearby
-        
     Args:
-        flight_data: Dict with "total" and "military" flight counts
-        source_data: Dict with "tier1", "tier2", "tier3" counts
+        engine: CorrelationEngine instance
+        scored_at: Timestamp of the scoring run
+        limit: Maximum number of events to return
         
     Returns:
-        Confidence score (0-100)
+        List of event records with id, location, score, status, sources
+    """
+    query = """
+    MATCH (e:Event)
+    WHERE e.scored_at = $scored_at
+    WITH e
+    ORDER BY e.confidence_score DESC
+    LIMIT $limit
+    OPTIONAL MATCH (e)-[:OCCURRED_IN]->(loc:Location)
+    OPTIONAL MATCH (e)<-[:CORROBORATES]-(:Article)<-[:PUBLISHED]-(s:Source)
+    WITH e, loc, collect(DISTINCT s.name)[..3] AS sources
+    RETURN 
+        e.id AS id,
+        loc.name AS location,
+        e.confidence_score AS score,
+        e.status AS status,
+        sources
+    ORDER BY score DESC
     """
-    score = 0
-    
-    # Tier 1 sources (wire services like NPR, BBC)
-    if source_data.get("tier1", 0) > 0:
-        score += SCORE_TIER1_SOURCE
-    
-    # Tier 2 sources (mainstream international)
-    if source_data.get("tier2", 0) > 0:
-        score += SCORE_TIER2_SOURCE
-    
-    # Tier 3 sources (Telegram, local) - capped to prevent bot swarm inflation
-    tier3_count = source_data.get("tier3", 0)
-    tier3_score = min(tier3_count * SCORE_TIER3_SOURCE, SCORE_TIER3_CAP)
-    score += tier3_score
-    
-    # Military flight correlation (strongest signal)
-    if flight_data.get("military", 0) > 0:
-        score += SCORE_MILITARY_FLIGHT
     
-    # Cap at 100
-    return min(score, 100)
+    return engine.run_query(query, {"scored_at": scored_at, "limit": limit})
 
 
-def get_status(score: int) -> str:
+# ==============================================================================
+# CROSS-VALIDATION
+# ==============================================================================
+
+def load_flight_positions(filepath: Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load aircraft positions from the flight snapshot as NumPy arrays.
+    
+    Args:
+        filepath: Path to flight_radar.json
+        
+    Returns:
+        Tuple of (latitudes in radians, longitudes in radians, military mask);
+        aircraft without a position are left out
     """
-    Classify event status based on confidence score.
+    aircraft = orjson.loads(filepath.read_bytes()).get("aircraft", [])
+    positioned = [
+        a for a in aircraft
+        if a.get("latitude") is not None and a.get("longitude") is not None
+    ]
+    
+    lat = np.radians(np.array([a["latitude"] for a in positioned], dtype=np.float64))
+    lon = np.radians(np.array([a["longitude"] for a in positioned], dtype=np.float64))
+    military = np.array([a.get("tag") == "high_altitude_fast" for a in positioned], dtype=bool)
+    return lat, lon, military
+
+
+def count_nearby_flights(
+    events: List[Dict],
+    lat: np.ndarray,
+    lon: np.ndarray,
+    military: np.ndarray,
+    radius_km: float = SPATIAL_RADIUS_KM
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Count flights near each event with a vectorized haversine.
+    
+    Each event is compared against every aircraft in one pass of
+    contiguous float64 array operations, with no per-flight Python loop.
     
     Args:
-        score: Confidence score (0-100)
+        events: Event dicts with id, lat, lon
+        lat: Aircraft latitudes (radians)
+        lon: Aircraft longitudes (radians)
+        military: Mask of high_altitude_fast aircraft
+        radius_km: Max distance (km)
         
     Returns:
-        Status string: "Unverified", "Plausible", or "Confirmed"
+        Dict of event id -> (total flights, military flights)
     """
-    if score < STATUS_UNVERIFIED:
-        return "Unverified"
-    elif score < STATUS_PLAUSIBLE:
-        return "Plausible"
-    else:
-        return "Confirmed"
+    cos_lat = np.cos(lat)
+    counts = {}
+    
+    for event in events:
+        if not all([event.get('id'), event.get('lat'), event.get('lon')]):
+            continue
+        
+        ev_lat = math.radians(event['lat'])
+        ev_lon = math.radians(event['lon'])
+        a = (
+            np.sin((lat - ev_lat) / 2) ** 2
+            + math.cos(ev_lat) * cos_lat * np.sin((lon - ev_lon) / 2) ** 2
+        )
+        near = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0))) <= radius_km
+        counts[event['id']] = (int(near.sum()), int((near & military).sum()))
+    
+    return counts
 
 
-def update_event_score(engine: CorrelationEngine, event_id: str, score: int, status: str):
+def verify_flight_links(events: List[Dict], scored: List[Dict]):
     """
-    Write back confidence score and status to the Event node.
+    Cross-check the graph's flight links against the flight snapshot.
+    
+    Recomputes the per-event flight counts in NumPy from FLIGHTS_FILE and
+    reports events whose DETECTED_NEAR counts differ. Counts can also
+    differ when the graph holds flights from earlier snapshots.
     
     Args:
-        engine: CorrelationEngine instance
-        event_id: Event node ID
-        score: Calculated confidence score
-        status: Classification status
-    """
-    query = """
-    MATCH (e:Event {id: $event_id})
-    SET e.confidence_score = $score,
-        e.status = $status,
-        e.scored_at = $scored_at
+        events: Event dicts with id, lat, lon
+        scored: Rows returned by correlate_events()
     """
+    print(f"\n🛩️  Verifying flight links against {FLIGHTS_FILE.name}...")
     
-    engine.run_query(query, {
-        "event_id": event_id,
-        "score": score,
-        "status": status,
-        "scored_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-    })
+    if not FLIGHTS_FILE.exists():
+        print(f"   ⚠️  File not found: {FLIGHTS_FILE}")
+        return
+    
+    lat, lon, military = load_flight_positions(FLIGHTS_FILE)
+    expected = count_nearby_flights(events, lat, lon, military)
+    
+    mismatched = []
+    for row in scored:
+        graph_counts = (row.get('total_flights', 0), row.get('military_flights', 0))
+        file_counts = expected.get(row['id'], (0, 0))
+        if graph_counts != file_counts:
+            mismatched.append((row['id'], graph_counts, file_counts))
+    
+    if not mismatched:
+        print(f"   ✓ Flight links match for all {len(scored)} events ({len(lat)} aircraft)")
+        return
+    
+    print(f"   ⚠️  {len(mismatched)} events differ (graph vs. snapshot: total/military)")
+    for event_id, graph_counts, file_counts in mismatched[:5]:
+        print(f"      {event_id}: {graph_counts[0]}/{graph_counts[1]} vs. {file_counts[0]}/{file_counts[1]}")
 
 
 # ==============================================================================
 # MAIN ENTRY POINT
 # ==============================================================================
 
-def main():
+def main(verify_flights: bool = False):
     """
     Main entry point for the Correlation Engine.
     
     Orchestrates the corroboration scoring pipeline:
     1. Get recent events from Neo4j
-    2. For each event: spatial linking, narrative linking, scoring
-    3. Write back scores and print summary table
+    2. Link, score and classify all events on the server (batched queries)
+    3. Print the top events and status counts (queried from Neo4j)
+    
+    Args:
+        verify_flights: If True, cross-check flight links against the
+            flight snapshot file with a NumPy haversine
     """
     print("=" * 80)
     print("🔬 CORRELATION ENGINE: Multi-Source Corroboration Scoring")
@@ -450,7 +660,11 @@ def main():
     try:
         # Get recent events
         print(f"\n📊 Fetching events from last {EVENT_LOOKBACK_HOURS} hours...")
-        events = get_recent_events(engine, EVENT_LOOKBACK_HOURS)
+        # One timestamp for the whole run: the lookback cutoff and the
+        # scored_at value written to every event derive from it
+        run_started = datetime.now(timezone.utc)
+        scored_at = run_started.strftime(ISO_UTC_FORMAT)
+        events = get_recent_events(engine, run_started, EVENT_LOOKBACK_HOURS)
         
         if not events:
             print("   ⚠️  No recent events found in database")
@@ -459,40 +673,15 @@ def main():
         
         print(f"   ✓ Found {len(events)} events to analyze")
         
-        # Process each event
         print(f"\n🔗 Analyzing corroboration...")
-        results = []
         
-        for i, event in enumerate(events):
-            event_id = event.get('id', 'unknown')
-            
-            # Step A: Spatial linking
-            flight_data = link_nearby_flights(engine, event)
-            
-            # Step B: Narrative linking  
-            source_data = link_narrative_sources(engine, event)
-            
-            # Step C: Calculate score
-            score = calculate_score(flight_data, source_data)
-            status = get_status(score)
-            
-            # Write back to Neo4j
-            update_event_score(engine, event_id, score, status)
-            
-            # Collect for display
-            results.append({
-                "id": event_id[:20] + "..." if len(event_id) > 20 else event_id,
-                "location": event.get('grid_location', 'Unknown'),
-                "score": score,
-                "status": status,
-                "sources": ", ".join(source_data.get('sources', [])[:3]) or "None",
-                "flights": flight_data.get('total', 0),
-                "military": flight_data.get('military', 0),
-            })
-            
-            # Progress indicator every 100 events
-            if (i + 1) % 100 == 0:
-                print(f"   Processed {i + 1}/{len(events)} events...")
+        # Steps A-C: link, score and write back in batched queries
+        scored = correlate_events(engine, events, scored_at)
+        
+        # Display data is aggregated on the server from this run's writes
+        status_counts = get_status_counts(engine, scored_at)
+        total = sum(status_counts.values())
+        top_events = get_top_events(engine, scored_at)
         
         # Print summary table
         print("\n" + "=" * 80)
@@ -501,34 +690,46 @@ def main():
         print(f"{'Event ID':<24} {'Location':<15} {'Score':>6} {'Status':<12} {'Sources':<20}")
         print("-" * 80)
         
-        # Sort by score descending
-        results.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Show top 20 or all if fewer
-        display_count = min(20, len(results))
-        for r in results[:display_count]:
+        # Show top 20 or all if fewer, by score descending
+        for r in top_events:
+            event_id = r['id'][:20] + "..." if len(r['id']) > 20 else r['id']
+            location = r['location'] or 'Unknown'
+            sources = ", ".join(r['sources']) or "None"
             status_icon = "✅" if r['status'] == "Confirmed" else "⚠️ " if r['status'] == "Plausible" else "❓"
-            print(f"{r['id']:<24} {r['location']:<15} {r['score']:>6} {status_icon} {r['status']:<10} {r['sources']:<20}")
+            print(f"{event_id:<24} {location:<15} {r['score']:>6} {status_icon} {r['status']:<10} {sources:<20}")
         
-        if len(results) > display_count:
-            print(f"... and {len(results) - display_count} more events")
+        if total > len(top_events):
+            print(f"... and {total - len(top_events)} more events")
         
         # Summary statistics
         print("\n" + "-" * 80)
-        confirmed = sum(1 for r in results if r['status'] == "Confirmed")
-        plausible = sum(1 for r in results if r['status'] == "Plausible")
-        unverified = sum(1 for r in results if r['status'] == "Unverified")
+        confirmed = status_counts.get("Confirmed", 0)
+        plausible = status_counts.get("Plausible", 0)
+        unverified = status_counts.get("Unverified", 0)
         
         print(f"📈 SUMMARY")
         print(f"   Confirmed:   {confirmed:>5} events (score > 60)")
         print(f"   Plausible:   {plausible:>5} events (score 30-60)")
         print(f"   Unverified:  {unverified:>5} events (score < 30)")
-        print(f"   Total:       {len(results):>5} events analyzed")
+        print(f"   Total:       {total:>5} events analyzed")
         print("=" * 80)
         
+        if verify_flights:
+            verify_flight_links(events, scored)
+        
     finally:
         engine.close()
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Score conflict events by corroborating evidence")
+    parser.add_argument(
+        "--verify-flights",
+        action="store_true",
+        help="Cross-check flight links against data/flight_radar.json"
+    )
+    args = parser.parse_args()
+    
+    main(verify_flights=args.verify_flights)
@@ -19,13 +19,20 @@ Graph Schema:
     - (:Source)   - News sources (Reuters, BBC, etc.)
     - (:Channel)  - Telegram channels
     - (:Location) - Geographic locations (countries, cities, regions)
+    - (:Meta)     - Per-source load watermarks and tuned batch sizes
     
     RELATIONSHIPS:
     - (:Source)-[:PUBLISHED]->(:Article)
     - (:Channel)-[:POSTED]->(:Post)
     - (:Flight)-[:PATROLLING]->(:Location)
     - (:Article)-[:MENTIONS]->(:Location)
+    - (:Post)-[:MENTIONS]->(:Location)
     - (:Event)-[:OCCURRED_IN]->(:Location)
+    
+    Each relationship is stored once, in the direction above. Neo4j
+    traverses relationships both ways at the same cost, so there are no
+    reverse types (e.g. HAS_ARTICLE); match against the arrow, e.g.
+    (loc:Location)<-[:MENTIONS]-(a:Article), or undirected.
     -------------------------------------------------------------------------
 
 Connection:
@@ -37,19 +44,35 @@ Created: 2026
 ==============================================================================
 """
 
-import json
+import csv
+import math
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
+import ijson
+import orjson
 from dotenv import load_dotenv
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+    retry_if_exception_type
+)
 
 try:
     from neo4j import GraphDatabase
-    from neo4j.exceptions import ServiceUnavailable, AuthError
+    from neo4j.exceptions import AuthError, ServiceUnavailable, SessionExpired, TransientError
 except ImportError:
     print("❌ ERROR: neo4j driver not installed.")
     print("   Run: pip install neo4j")
@@ -67,13 +90,22 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "sentinel_password")
 
+# Driver connection pool (shared by the concurrent loaders)
+MAX_CONNECTION_POOL_SIZE = 64
+CONNECTION_ACQUISITION_TIMEOUT = 120  # seconds
+MAX_CONNECTION_LIFETIME = 3600        # seconds
+
 # Data file paths
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 GDELT_FILE = DATA_DIR / "kinetic_events.json"
-NEWS_FILE = DATA_DIR / "news_feed.json"
+NEWS_FILE = DATA_DIR / "news_feed.jsonl"
+NEWS_META_FILE = DATA_DIR / "news_feed.meta.json"
 TELEGRAM_FILE = DATA_DIR / "telegram_feed.json"
 FLIGHTS_FILE = DATA_DIR / "flight_radar.json"
 
+# Bulk load staging: mounted as the server's import directory (docker-compose.yml)
+IMPORT_DIR = Path(__file__).parent.parent.parent / "neo4j" / "import"
+
 # Location keywords for entity linking
 # Maps keywords to standardized location names
 LOCATION_KEYWORDS = {
@@ -110,14 +142,165 @@ LOCATION_KEYWORDS = {
     "golan": "Golan Heights",
 }
 
+# All keywords as one alternation, longest first. The lookahead matches at
+# every position, so overlapping mentions are found just like substring
+# tests, but the text is scanned once instead of once per keyword
+_LOCATION_RE = re.compile(
+    "(?=(" + "|".join(
+        re.escape(keyword)
+        for keyword in sorted(LOCATION_KEYWORDS, key=len, reverse=True)
+    ) + "))"
+)
+
 # Batch size for transactions
-BATCH_SIZE = 500
+BATCH_SIZE = 500                # Wide records (articles, posts with text)
+FLIGHT_BATCH_SIZE = 5000        # Small fixed-width records (flights, events)
+MIN_TUNED_BATCH_SIZE = 2000     # Bounds of the tuned event/flight batch size
+MAX_TUNED_BATCH_SIZE = 50000
+BULK_BATCH_SIZE = 10000         # Rows per LOAD CSV transaction (--bulk)
+WIPE_BATCH_SIZE = 10000         # Nodes deleted per transaction (--wipe)
+WRITE_ATTEMPTS = 5              # Tries per batch on transient/connection errors
+BATCHES_IN_FLIGHT = 8           # Concurrent write transactions per run_batch call
+BATCHES_QUEUED = 4              # Prepared batches waiting for a free writer
+
+# Loaders run concurrently; each buffers its log lines and emits them
+# under this lock in one write, so output from different loaders never
+# interleaves
+_print_lock = threading.Lock()
+
+# Properties each loader writes. Records are projected to these before
+# they are sent, so unused source fields are not encoded and sent over Bolt
+EVENT_FIELDS = ("id", "timestamp", "lat", "lon", "event_code", "actor_1",
+                "actor_2", "source_url", "goldstein_scale")
+ARTICLE_FIELDS = ("id", "source_id", "title", "summary", "link", "published_utc", "priority")
+POST_FIELDS = ("source_id", "text", "date", "message_id", "priority")
+FLIGHT_FIELDS = ("icao24", "callsign", "origin_country", "latitude", "longitude",
+                 "geo_altitude", "velocity", "tag", "on_ground")
+
+
+def _set_items(node: str, row: str, fields: Iterable[str]) -> str:
+    """Cypher SET items copying each field of a row map onto a node."""
+    return ",\n        ".join(f"{node}.{field} = {row}.{field}" for field in fields)
+
+
+# Event and Flight node writes, shared by the batched (UNWIND) and the bulk
+# (LOAD CSV) path. The SET lists are generated from the field tuples above,
+# so the queries cannot drift from the projected records. The full query
+# strings are built once at import: every batch sends the same
+# parameterized text, so the server plans it once
+_EVENT_WRITE = f"""
+    MERGE (e:Event {{id: event.id}})
+    SET {_set_items("e", "event", (f for f in EVENT_FIELDS if f != "id"))},
+        e.location = point({{latitude: event.lat, longitude: event.lon}})
+"""
+
+# A Flight's origin country is fixed by its icao24, so it is only set once
+_FLIGHT_WRITE = f"""
+    MERGE (f:Flight {{icao24: flight.icao24}})
+    ON CREATE SET f.origin_country = flight.origin_country
+    SET {_set_items("f", "flight", (f for f in FLIGHT_FIELDS if f not in ("icao24", "origin_country")))},
+        f.location = point({{latitude: flight.latitude, longitude: flight.longitude}})
+"""
+
+EVENT_QUERY = "UNWIND $batch AS event" + _EVENT_WRITE
+FLIGHT_QUERY = "UNWIND $batch AS flight" + _FLIGHT_WRITE
+
+# LOAD CSV reads every column as a string (empty ones as null)
+EVENT_CSV_QUERY = f"""
+LOAD CSV WITH HEADERS FROM $url AS row
+CALL {{
+    WITH row
+    WITH row {{.*,
+        lat: toFloat(row.lat),
+        lon: toFloat(row.lon),
+        goldstein_scale: toFloat(row.goldstein_scale)
+    }} AS event
+    {_EVENT_WRITE}
+}} IN TRANSACTIONS OF {BULK_BATCH_SIZE} ROWS
+"""
+
+FLIGHT_CSV_QUERY = f"""
+LOAD CSV WITH HEADERS FROM $url AS row
+CALL {{
+    WITH row
+    WITH row {{.*,
+        latitude: toFloat(row.latitude),
+        longitude: toFloat(row.longitude),
+        geo_altitude: toFloat(row.geo_altitude),
+        velocity: toFloat(row.velocity),
+        on_ground: toBoolean(row.on_ground)
+    }} AS flight
+    {_FLIGHT_WRITE}
+}} IN TRANSACTIONS OF {BULK_BATCH_SIZE} ROWS
+"""
+
+# Relationship phases (apoc.periodic.iterate)
+LINK_BATCH_SIZE = 1000          # Rows per parallel link transaction
+LINK_CONCURRENCY = 8            # Parallel link transactions
+LINK_RETRIES = 3                # Retries per batch (lock conflicts on shared nodes)
+
+
+# ==============================================================================
+# BATCH SIZE TUNING
+# ==============================================================================
+
+class BatchSizer:
+    """
+    Hill-climbing controller for the batch size of one loader.
+    
+    run_batch reports the rows and write time of every full batch. While
+    the rate (rows per second) improves, the size keeps moving the same
+    way (x1.5 up, x0.7 down); when it drops, the direction reverses. The
+    size stays within MIN_TUNED_BATCH_SIZE..MAX_TUNED_BATCH_SIZE, and the
+    size with the best observed rate is kept for the next run.
+    """
+    
+    def __init__(self, size: int):
+        self.size = self.best = self._clamp(size)
+        self._growing = True
+        self._last_rate = None
+        self._best_rate = 0.0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _clamp(size: float) -> int:
+        return min(max(int(size), MIN_TUNED_BATCH_SIZE), MAX_TUNED_BATCH_SIZE)
+    
+    def record(self, rows: int, elapsed: float):
+        """Adjust the size after `rows` were written in `elapsed` seconds."""
+        rate = rows / max(elapsed, 1e-6)
+        with self._lock:
+            if rate > self._best_rate:
+                self._best_rate, self.best = rate, rows
+            if self._last_rate is not None and rate < self._last_rate:
+                self._growing = not self._growing
+            self._last_rate = rate
+            self.size = self._clamp(self.size * (1.5 if self._growing else 0.7))
 
 
 # ==============================================================================
 # DATABASE CONNECTION
 # ==============================================================================
 
+@retry(
+    stop=stop_after_attempt(WRITE_ATTEMPTS),
+    wait=wait_exponential(multiplier=0.1, max=5) + wait_random(0, 0.1),  # 0.1s, 0.2s, 0.4s... plus jitter
+    retry=retry_if_exception_type((TransientError, ServiceUnavailable, SessionExpired)),
+    reraise=True
+)
+def write_batch_with_retry(session, query: str, batch: List[Dict]):
+    """
+    Write one batch in a managed transaction, retrying it if that fails.
+    
+    The driver already retries a managed transaction for a while; this
+    covers errors that outlast it (a deadlock storm, a restarting server).
+    The writes are MERGEs, so replaying a batch is safe.
+    """
+    session.execute_write(
+        lambda tx: tx.run(query, {"batch": batch}).consume()
+    )
+
+
 class Neo4jLoader:
     """
     Neo4j database loader with connection management and ETL functions.
@@ -127,7 +310,14 @@ class Neo4jLoader:
         """Initialize Neo4j driver connection."""
         self.driver = None
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(user, password))
+            self.driver = GraphDatabase.driver(
+                uri,
+                auth=(user, password),
+                max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+                connection_acquisition_timeout=CONNECTION_ACQUISITION_TIMEOUT,
+                max_connection_lifetime=MAX_CONNECTION_LIFETIME,
+                keep_alive=True,
+            )
             # Verify connection
             with self.driver.session() as session:
                 session.run("RETURN 1")
@@ -151,18 +341,124 @@ class Neo4jLoader:
             result = session.run(query, parameters or {})
             return result.consume()
     
-    def run_batch(self, query: str, data: List[Dict], batch_size: int = BATCH_SIZE):
-        """Execute a query in batches for large datasets."""
-        total = len(data)
+    def fetch(self, query: str, parameters: Dict = None) -> List[Dict]:
+        """Execute a Cypher query and return results as list of dicts."""
+        with self.driver.session() as session:
+            return [record.data() for record in session.run(query, parameters or {})]
+    
+    def run_batch(self, query: str, data: Iterable[Dict], batch_size: int = BATCH_SIZE,
+                  sizer: Optional[BatchSizer] = None):
+        """
+        Execute a query in batches for large datasets.
+        
+        Records are pulled from the iterable batch_size at a time, so
+        generators are loaded without building the full list first. Each
+        batch is a managed write transaction, which the driver retries on
+        transient errors (including deadlocks between concurrent batches);
+        a batch that still fails is retried with backoff up to
+        WRITE_ATTEMPTS times before the load aborts.
+        
+        Up to BATCHES_IN_FLIGHT batches are written concurrently, so the
+        next batch is encoded and sent while earlier ones execute. The
+        calling thread extracts ahead of the writers: up to BATCHES_QUEUED
+        prepared batches wait in the executor's queue, so a writer picks up
+        its next batch as soon as it finishes instead of waiting for the
+        reader. Reading stops while the queue is full, which keeps memory
+        bounded.
+        
+        Sessions are not thread-safe, so each worker thread opens one
+        session on its first batch and reuses it for the rest of the call.
+        
+        With a sizer, batch_size is ignored: each batch is cut at the
+        sizer's current size, and every full batch reports its write time
+        back to it.
+        """
+        local = threading.local()
+        sessions = []
+        
+        def write_batch(batch: List[Dict], full: bool) -> int:
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = self.driver.session()
+                sessions.append(session)
+            started = time.perf_counter()
+            write_batch_with_retry(session, query, batch)
+            if sizer and full:
+                sizer.record(len(batch), time.perf_counter() - started)
+            return len(batch)
+        
+        records = iter(data)
         processed = 0
+        in_flight = set()
         
-        with self.driver.session() as session:
-            for i in range(0, total, batch_size):
-                batch = data[i:i + batch_size]
-                session.run(query, {"batch": batch})
-                processed += len(batch)
+        try:
+            with ThreadPoolExecutor(max_workers=BATCHES_IN_FLIGHT) as executor:
+                while True:
+                    size = sizer.size if sizer else batch_size
+                    batch = list(islice(records, size))
+                    if not batch:
+                        break
+                    if len(in_flight) >= BATCHES_IN_FLIGHT + BATCHES_QUEUED:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        processed += sum(future.result() for future in done)
+                    in_flight.add(executor.submit(write_batch, batch, len(batch) == size))
+                
+                processed += sum(future.result() for future in in_flight)
+        finally:
+            for session in sessions:
+                session.close()
         
         return processed
+    
+    def run_iterate(self, action: str, rows: List[Dict], log: List[str]) -> int:
+        """
+        Run an action per row with apoc.periodic.iterate in parallel batches.
+        
+        Used for relationship phases between nodes that already exist.
+        Batches that conflict on shared nodes (e.g. the same grid cell)
+        are retried by APOC; batches that still fail are reported.
+        
+        Args:
+            action: Cypher statement run for each `row`
+            rows: Parameter rows, passed to the server once
+            log: Log lines of the calling loader (failures are added)
+            
+        Returns:
+            Number of rows committed
+        """
+        if not rows:
+            return 0
+        
+        query = """
+        CALL apoc.periodic.iterate(
+            'UNWIND $rows AS row RETURN row',
+            $action,
+            {
+                batchSize: $batch_size,
+                parallel: true,
+                concurrency: $concurrency,
+                retries: $retries,
+                params: {rows: $rows}
+            }
+        )
+        YIELD committedOperations, failedOperations, errorMessages
+        RETURN committedOperations, failedOperations, errorMessages
+        """
+        
+        with self.driver.session() as session:
+            record = session.run(query, {
+                "action": action,
+                "rows": rows,
+                "batch_size": LINK_BATCH_SIZE,
+                "concurrency": LINK_CONCURRENCY,
+                "retries": LINK_RETRIES,
+            }).single()
+        
+        if record["failedOperations"]:
+            errors = "; ".join(record["errorMessages"].keys()) or "unknown error"
+            log.append(f"   ⚠️  {record['failedOperations']} links failed: {errors}")
+        
+        return record["committedOperations"]
 
 
 # ==============================================================================
@@ -173,7 +469,8 @@ def create_constraints(loader: Neo4jLoader):
     """
     Create uniqueness constraints to prevent duplicate nodes.
     
-    These constraints also create indexes for faster lookups.
+    These constraints also create indexes for faster lookups. The
+    secondary indexes are created separately by create_indexes().
     """
     print("\n📋 Creating schema constraints...")
     
@@ -185,6 +482,7 @@ def create_constraints(loader: Neo4jLoader):
         ("Source", "name"),
         ("Channel", "name"),
         ("Location", "name"),
+        ("Meta", "source"),
     ]
     
     for label, prop in constraints:
@@ -200,15 +498,90 @@ def create_constraints(loader: Neo4jLoader):
             print(f"   ⚠️  Constraint {label}.{prop}: {e}")
 
 
+def create_indexes(loader: Neo4jLoader, wait: bool = False):
+    """
+    Create the secondary (non-constraint) indexes.
+    
+    Point indexes are added for the Event and Flight locations, and range
+    indexes for the timestamps that time-window queries filter on.
+    
+    Args:
+        loader: Neo4jLoader instance
+        wait: If True, block until the indexes are online (after a
+            reload, they are populated from the existing data)
+    """
+    print("\n📋 Creating secondary indexes...")
+    
+    # Point indexes back the correlation engine's distance queries
+    point_indexes = [
+        ("event_location", "Event"),
+        ("flight_location", "Flight"),
+    ]
+    
+    for name, label in point_indexes:
+        try:
+            query = f"""
+            CREATE POINT INDEX {name} IF NOT EXISTS
+            FOR (n:{label})
+            ON (n.location)
+            """
+            loader.run_query(query)
+            print(f"   ✓ Point index: {label}.location")
+        except Exception as e:
+            print(f"   ⚠️  Point index {label}.location: {e}")
+    
+    # Range indexes let time-window queries seek instead of scanning the label
+    range_indexes = [
+        ("event_ts", "Event", "timestamp"),
+        ("article_published", "Article", "published_utc"),
+    ]
+    
+    for name, label, prop in range_indexes:
+        try:
+            query = f"""
+            CREATE INDEX {name} IF NOT EXISTS
+            FOR (n:{label})
+            ON (n.{prop})
+            """
+            loader.run_query(query)
+            print(f"   ✓ Range index: {label}.{prop}")
+        except Exception as e:
+            print(f"   ⚠️  Range index {label}.{prop}: {e}")
+    
+    if wait:
+        loader.run_query("CALL db.awaitIndexes()")
+        print("   ✓ Indexes online")
+
+
 def wipe_database(loader: Neo4jLoader):
     """
     Delete all nodes and relationships (development reset).
     
+    Secondary indexes are dropped as well, so the reload does not
+    maintain them per write; main() recreates them once the data is in.
+    Constraint-backed and token lookup indexes are kept.
+    
+    Nodes are deleted WIPE_BATCH_SIZE at a time in separate transactions
+    (run server-side by one auto-commit query), so a large graph is not
+    deleted in one transaction that has to hold every change in memory.
+    
     ⚠️  DESTRUCTIVE - Only use during development!
     """
     print("\n🗑️  Wiping database...")
-    loader.run_query("MATCH (n) DETACH DELETE n")
+    loader.run_query(f"""
+    MATCH (n)
+    CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {WIPE_BATCH_SIZE} ROWS
+    """)
     print("   ✓ All nodes and relationships deleted")
+    
+    indexes = loader.fetch("""
+    SHOW INDEXES YIELD name, type, owningConstraint
+    WHERE owningConstraint IS NULL AND type <> 'LOOKUP'
+    RETURN name
+    """)
+    for index in indexes:
+        loader.run_query(f"DROP INDEX `{index['name']}` IF EXISTS")
+    print(f"   ✓ Dropped {len(indexes)} secondary indexes")
 
 
 # ==============================================================================
@@ -228,17 +601,173 @@ def extract_locations(text: str) -> List[str]:
     if not text:
         return []
     
-    text_lower = text.lower()
-    found = set()
+    return list({
+        LOCATION_KEYWORDS[match.group(1)]
+        for match in _LOCATION_RE.finditer(text.lower())
+    })
+
+
+def emit_log(lines: List[str]):
+    """
+    Print a block of log lines atomically.
+    
+    Args:
+        lines: Lines buffered by a single loader
+    """
+    with _print_lock:
+        print("\n".join(lines))
+
+
+def get_watermark(loader: Neo4jLoader, source: str) -> Optional[Any]:
+    """
+    Read the load watermark of a source (None if it was never loaded).
+    
+    Watermarks live on (:Meta {source}) nodes, so a wipe resets them and
+    the next run loads everything again.
+    """
+    rows = loader.fetch(
+        "MATCH (m:Meta {source: $source}) RETURN m.watermark AS watermark",
+        {"source": source}
+    )
+    return rows[0]["watermark"] if rows else None
+
+
+def set_watermark(loader: Neo4jLoader, source: str, value: Any,
+                  batch_size: Optional[int] = None):
+    """
+    Record the load watermark of a source after a successful load.
+    
+    A tuned batch size, if given, is stored alongside it; otherwise the
+    stored one is kept.
+    """
+    loader.run_query(
+        """
+        MERGE (m:Meta {source: $source})
+        SET m.watermark = $value,
+            m.batch_size = coalesce($batch_size, m.batch_size),
+            m.updated_at = datetime()
+        """,
+        {"source": source, "value": value, "batch_size": batch_size}
+    )
+
+
+def get_batch_sizer(loader: Neo4jLoader, source: str) -> BatchSizer:
+    """Batch size controller of a source, starting from its last tuned size."""
+    rows = loader.fetch(
+        "MATCH (m:Meta {source: $source}) RETURN m.batch_size AS batch_size",
+        {"source": source}
+    )
+    return BatchSizer((rows[0]["batch_size"] if rows else None) or FLIGHT_BATCH_SIZE)
+
+
+def iter_ndjson(filepath: Path, start: int = 0, end: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Lazily read an NDJSON file, one record per non-blank line.
+    
+    Args:
+        filepath: Path to the NDJSON file
+        start: Byte offset to start reading at (a line boundary)
+        end: Byte offset to stop at; lines appended after it are left
+            for the next run
+        
+    Yields:
+        Parsed records in file order
+    """
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        position = start
+        while end is None or position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def bulk_load(loader: Neo4jLoader, filename: str, fields: Tuple[str, ...],
+              records: Iterable[Dict], query: str) -> int:
+    """
+    Stage records as CSV in the import directory and load them with LOAD CSV.
+    
+    The server reads the file itself and commits it in transactions of
+    BULK_BATCH_SIZE rows, so no parameters travel over Bolt.
+    
+    Args:
+        loader: Neo4jLoader instance
+        filename: CSV file name inside IMPORT_DIR
+        fields: Record keys to write as columns (others are dropped)
+        records: Records to stage
+        query: LOAD CSV query reading from $url
+        
+    Returns:
+        Number of staged rows
+    """
+    IMPORT_DIR.mkdir(parents=True, exist_ok=True)
     
-    for keyword, location in LOCATION_KEYWORDS.items():
-        if keyword in text_lower:
-            found.add(location)
+    count = 0
+    with open(IMPORT_DIR / filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
     
-    return list(found)
+    if count:
+        loader.run_query(query, {"url": f"file:///{filename}"})
+    return count
+
+
+def project(record: Dict, fields: Iterable[str]) -> Dict:
+    """Keep only the given fields of a record (missing ones become None)."""
+    return {field: record.get(field) for field in fields}
 
 
-def load_gdelt(loader: Neo4jLoader):
+def grid_cell(lat: float, lon: float) -> Dict[str, Any]:
+    """
+    Compute the 1° grid cell for a coordinate pair.
+    
+    Halves round away from zero (like Cypher's round(x, 0), not Python's
+    round()), and the name uses integers to match the Grid_<lat>_<lon>
+    keys of the correlation engine.
+    
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        
+    Returns:
+        Dict with grid (cell name), grid_lat and grid_lon
+    """
+    grid_lat = int(math.copysign(math.floor(abs(lat) + 0.5), lat))
+    grid_lon = int(math.copysign(math.floor(abs(lon) + 0.5), lon))
+    return {"grid": f"Grid_{grid_lat}_{grid_lon}", "grid_lat": grid_lat, "grid_lon": grid_lon}
+
+
+def create_grid_cells(loader: Neo4jLoader, cells: Iterable[Dict]) -> int:
+    """
+    Create one Location node per grid cell.
+    
+    Cells are created before the nodes that link to them, so the link
+    phases only look cells up. A cell's coordinates follow from its
+    name, so they are only set when the cell is created.
+    
+    Args:
+        loader: Neo4jLoader instance
+        cells: grid_cell() dicts, one per distinct cell
+        
+    Returns:
+        Number of cells written
+    """
+    query = """
+    UNWIND $batch AS cell
+    MERGE (loc:Location {name: cell.grid})
+    ON CREATE SET loc.lat = cell.grid_lat,
+        loc.lon = cell.grid_lon
+    """
+    return loader.run_batch(query, cells)
+
+
+def load_gdelt(loader: Neo4jLoader, log: List[str], bulk: bool = False):
     """
     Load GDELT conflict events into Neo4j.
     
@@ -246,54 +775,73 @@ def load_gdelt(loader: Neo4jLoader):
     - (:Event) nodes with conflict data
     - (:Location) nodes based on coordinates
     - [:OCCURRED_IN] relationships
+    
+    Args:
+        loader: Neo4jLoader instance
+        log: Buffer for this loader's log lines
+        bulk: If True, load the events with LOAD CSV instead of batches
     """
-    print("\n📥 Loading GDELT events...")
+    log.append("\n📥 Loading GDELT events...")
     
     if not GDELT_FILE.exists():
-        print(f"   ⚠️  File not found: {GDELT_FILE}")
+        log.append(f"   ⚠️  File not found: {GDELT_FILE}")
         return 0
     
-    with open(GDELT_FILE, 'r') as f:
-        events = json.load(f)
-    
-    if not events:
-        print("   ⚠️  No events to load")
+    # The file is a snapshot rewritten by every ingest run. Event dates
+    # are day-resolution and ids are positional, so rows cannot be
+    # filtered individually; an unchanged snapshot is skipped instead
+    modified = GDELT_FILE.stat().st_mtime_ns
+    if get_watermark(loader, "gdelt") == modified:
+        log.append("   ✓ Unchanged since the last load")
         return 0
     
-    # Create Event nodes
-    query = """
-    UNWIND $batch AS event
-    MERGE (e:Event {id: event.id})
-    SET e.timestamp = event.timestamp,
-        e.lat = event.lat,
-        e.lon = event.lon,
-        e.event_code = event.event_code,
-        e.actor_1 = event.actor_1,
-        e.actor_2 = event.actor_2,
-        e.source_url = event.source_url,
-        e.goldstein_scale = event.goldstein_scale
+    events = orjson.loads(GDELT_FILE.read_bytes())
     
-    WITH e, event
+    if not events:
+        log.append("   ⚠️  No events to load")
+        return 0
     
-    // Create Location based on rounded coordinates
-    MERGE (loc:Location {name: 'Grid_' + toString(round(event.lat, 0)) + '_' + toString(round(event.lon, 0))})
-    SET loc.lat = round(event.lat, 0),
-        loc.lon = round(event.lon, 0)
+    # Add unique IDs if not present (an event's own id takes precedence)
+    # and collect the grid cell of each event for the link phase
+    prepared = []
+    cells = {}
+    links = []
+    for i, event in enumerate(events):
+        record = project({"id": f"gdelt_{i}_{event.get('timestamp', '')}", **event}, EVENT_FIELDS)
+        cell = grid_cell(event['lat'], event['lon'])
+        cells[cell["grid"]] = cell
+        links.append({"id": record["id"], "grid": cell["grid"]})
+        prepared.append(record)
     
-    MERGE (e)-[:OCCURRED_IN]->(loc)
-    """
+    # Create Event nodes
+    sizer = None
+    if bulk:
+        count = bulk_load(loader, "kinetic_events.csv", EVENT_FIELDS, prepared, EVENT_CSV_QUERY)
+    else:
+        sizer = get_batch_sizer(loader, "gdelt")
+        count = loader.run_batch(EVENT_QUERY, prepared, sizer=sizer)
     
-    # Add unique IDs if not present
-    for i, event in enumerate(events):
-        if 'id' not in event:
-            event['id'] = f"gdelt_{i}_{event.get('timestamp', '')}"
+    # Link events to their grid cells in parallel batches. Rows are
+    # ordered by cell, so each cell's links fall into one batch (or two
+    # adjacent ones) and parallel batches rarely lock the same cell
+    links.sort(key=itemgetter("grid"))
+    create_grid_cells(loader, cells.values())
+    occurred_in = loader.run_iterate(
+        """
+        MATCH (e:Event {id: row.id})
+        MATCH (loc:Location {name: row.grid})
+        MERGE (e)-[:OCCURRED_IN]->(loc)
+        """,
+        links,
+        log
+    )
     
-    count = loader.run_batch(query, events)
-    print(f"   ✓ Loaded {count} events")
+    set_watermark(loader, "gdelt", modified, sizer and sizer.best)
+    log.append(f"   ✓ Loaded {count} events ({occurred_in} grid links)")
     return count
 
 
-def load_news(loader: Neo4jLoader):
+def load_news(loader: Neo4jLoader, log: List[str]):
     """
     Load news articles into Neo4j.
     
@@ -303,33 +851,82 @@ def load_news(loader: Neo4jLoader):
     - (:Location) nodes for mentioned places
     - [:PUBLISHED] relationships
     - [:MENTIONS] relationships
+    
+    Args:
+        loader: Neo4jLoader instance
+        log: Buffer for this loader's log lines
     """
-    print("\n📥 Loading news articles...")
+    log.append("\n📥 Loading news articles...")
     
     if not NEWS_FILE.exists():
-        print(f"   ⚠️  File not found: {NEWS_FILE}")
+        log.append(f"   ⚠️  File not found: {NEWS_FILE}")
         return 0
     
-    with open(NEWS_FILE, 'r') as f:
-        data = json.load(f)
+    # Source tier/type come from the registry in the archive metadata.
+    # Archive lines written before the registry carry them inline instead
+    registry = {}
+    if NEWS_META_FILE.exists():
+        registry = orjson.loads(NEWS_META_FILE.read_bytes()).get("source_registry", {})
     
-    articles = data.get("articles", [])
-    if not articles:
-        print("   ⚠️  No articles to load")
+    # The archive is append-only, so the watermark is the byte offset
+    # loaded up to; only lines appended since are read. A smaller file
+    # means the archive was rotated and is loaded from the start
+    start = get_watermark(loader, "news") or 0
+    end = NEWS_FILE.stat().st_size
+    if start > end:
+        start = 0
+    
+    # The append-only NDJSON archive (one article per line) grows with
+    # every run, so it is streamed twice instead of held in memory: once
+    # here for the sources, then batch by batch for the articles
+    sources = {}
+    for article in iter_ndjson(NEWS_FILE, start, end):
+        source_id = article['source_id']
+        if source_id not in sources:
+            entry = registry.get(source_id, {})
+            sources[source_id] = {
+                "name": source_id,
+                "tier": entry.get("tier", article.get("source_tier")),
+                "type": entry.get("type", article.get("source_type")),
+            }
+    
+    if not sources:
+        log.append("   ✓ No new articles since the last load" if start else "   ⚠️  No articles to load")
         return 0
     
-    # Create Source and Article nodes with relationship
+    # One Source node per source, set once instead of once per article
+    source_query = """
+    UNWIND $batch AS source
+    MERGE (s:Source {name: source.name})
+    SET s.tier = source.tier,
+        s.type = source.type
+    """
+    loader.run_batch(source_query, list(sources.values()))
+    
+    # Entity linking: locations mentioned in the title and summary are
+    # extracted here and linked in the same query that creates the article
+    mentions = 0
+    
+    def linked_articles():
+        nonlocal mentions
+        for article in iter_ndjson(NEWS_FILE, start, end):
+            locations = extract_locations(
+                f"{article.get('title', '')} {article.get('summary', '')}"
+            )
+            mentions += len(locations)
+            yield {**project(article, ARTICLE_FIELDS), "locations": locations}
+    
+    # Create Article nodes with relationships
     query = """
     UNWIND $batch AS article
     
-    // Create Source node
-    MERGE (s:Source {name: article.source_id})
-    SET s.tier = article.source_tier,
-        s.type = article.source_type
+    // Source nodes were created above
+    MATCH (s:Source {name: article.source_id})
     
-    // Create Article node
+    // Create Article node. Articles do not change once published, so
+    // an article seen again is left as it is
     MERGE (a:Article {id: article.id})
-    SET a.title = article.title,
+    ON CREATE SET a.title = article.title,
         a.summary = article.summary,
         a.link = article.link,
         a.published_utc = article.published_utc,
@@ -337,90 +934,131 @@ def load_news(loader: Neo4jLoader):
     
     // Create PUBLISHED relationship
     MERGE (s)-[:PUBLISHED]->(a)
-    """
-    
-    count = loader.run_batch(query, articles)
-    print(f"   ✓ Loaded {count} articles")
     
-    # Entity linking: Connect articles to locations mentioned in title
-    print("   🔗 Linking articles to locations...")
-    
-    location_links = []
-    for article in articles:
-        title = article.get('title', '')
-        summary = article.get('summary', '')
-        locations = extract_locations(f"{title} {summary}")
-        
-        for loc in locations:
-            location_links.append({
-                "article_id": article['id'],
-                "location": loc
-            })
-    
-    if location_links:
-        link_query = """
-        UNWIND $batch AS link
-        
-        MATCH (a:Article {id: link.article_id})
-        MERGE (loc:Location {name: link.location})
+    // Create MENTIONS relationships
+    FOREACH (name IN article.locations |
+        MERGE (loc:Location {name: name})
         MERGE (a)-[:MENTIONS]->(loc)
-        """
-        loader.run_batch(link_query, location_links)
-        print(f"   ✓ Created {len(location_links)} location mentions")
+    )
+    """
+    
+    count = loader.run_batch(query, linked_articles())
+    set_watermark(loader, "news", end)
+    log.append(f"   ✓ Loaded {count} articles ({mentions} location mentions)")
     
     return count
 
 
-def load_telegram(loader: Neo4jLoader):
+def load_telegram(loader: Neo4jLoader, log: List[str]):
     """
     Load Telegram posts into Neo4j.
     
     Creates:
     - (:Channel) nodes for Telegram channels
     - (:Post) nodes for messages
+    - (:Location) nodes for mentioned places
     - [:POSTED] relationships
+    - [:MENTIONS] relationships
+    
+    Args:
+        loader: Neo4jLoader instance
+        log: Buffer for this loader's log lines
     """
-    print("\n📥 Loading Telegram posts...")
+    log.append("\n📥 Loading Telegram posts...")
     
     if not TELEGRAM_FILE.exists():
-        print(f"   ⚠️  File not found: {TELEGRAM_FILE}")
+        log.append(f"   ⚠️  File not found: {TELEGRAM_FILE}")
         return 0
     
-    with open(TELEGRAM_FILE, 'r') as f:
-        data = json.load(f)
+    data = orjson.loads(TELEGRAM_FILE.read_bytes())
     
     messages = data.get("messages", [])
     if not messages:
-        print("   ⚠️  No messages to load")
+        log.append("   ⚠️  No messages to load")
         return 0
     
-    # Create Channel and Post nodes with relationship
+    # Each scrape repeats the latest posts of every channel; only posts
+    # newer than the last one loaded from the same channel are written.
+    # Channels are scraped independently (one can be skipped on a
+    # FloodWait), so each keeps its own watermark on a
+    # (:Meta {source: 'telegram:<channel>'}) node, and message ids
+    # increase per channel, so there are no ties
+    last_ids = {
+        row["source"]: row["watermark"]
+        for row in loader.fetch(
+            "MATCH (m:Meta) WHERE m.source STARTS WITH 'telegram:' "
+            "RETURN m.source AS source, m.watermark AS watermark"
+        )
+    }
+    messages = [
+        msg for msg in messages
+        if msg.get('message_id') is None
+        or msg['message_id'] > last_ids.get("telegram:" + msg['source_id'].replace('telegram_', ''), -1)
+    ]
+    if not messages:
+        log.append("   ✓ No new posts since the last load")
+        return 0
+    
+    # Entity linking: locations mentioned in the text are extracted here
+    # and linked in the same query that creates the post, so correlation
+    # can traverse MENTIONS instead of searching post text
+    linked_messages = [
+        {**project(msg, POST_FIELDS), "locations": extract_locations(msg.get('text', ''))}
+        for msg in messages
+    ]
+    
+    # One Channel node per channel, created before the posts
+    # (source_id is telegram_channelname -> channelname)
+    channels = {msg['source_id'].replace('telegram_', '') for msg in messages}
+    channel_query = """
+    UNWIND $batch AS channel
+    MERGE (c:Channel {name: channel.name})
+    """
+    loader.run_batch(channel_query, [{"name": name} for name in channels])
+    
+    # Create Post nodes with relationships
     query = """
     UNWIND $batch AS msg
     
     // Extract channel name from source_id (telegram_channelname -> channelname)
     WITH msg, replace(msg.source_id, 'telegram_', '') AS channel_name
     
-    // Create Channel node
-    MERGE (c:Channel {name: channel_name})
+    MATCH (c:Channel {name: channel_name})
     
-    // Create Post node
+    // Create Post node (posts are written once, like articles)
     MERGE (p:Post {id: toString(msg.message_id) + '_' + channel_name})
-    SET p.text = msg.text,
+    ON CREATE SET p.text = msg.text,
         p.date = msg.date,
         p.message_id = msg.message_id,
         p.priority = msg.priority
     
     // Create POSTED relationship
     MERGE (c)-[:POSTED]->(p)
+    
+    // Create MENTIONS relationships
+    FOREACH (name IN msg.locations |
+        MERGE (loc:Location {name: name})
+        MERGE (p)-[:MENTIONS]->(loc)
+    )
     """
     
-    count = loader.run_batch(query, messages)
-    print(f"   ✓ Loaded {count} posts")
+    count = loader.run_batch(query, linked_messages)
+    mentions = sum(len(msg["locations"]) for msg in linked_messages)
+    
+    # Advance the watermark of each channel that had new posts
+    newest = {}
+    for msg in messages:
+        if msg.get('message_id') is not None:
+            source = "telegram:" + msg['source_id'].replace('telegram_', '')
+            newest[source] = max(newest.get(source, -1), msg['message_id'])
+    for source, message_id in newest.items():
+        set_watermark(loader, source, message_id)
+    
+    log.append(f"   ✓ Loaded {count} posts ({mentions} location mentions)")
     return count
 
 
-def load_flights(loader: Neo4jLoader):
+def load_flights(loader: Neo4jLoader, log: List[str], bulk: bool = False):
     """
     Load flight data into Neo4j.
     
@@ -428,49 +1066,67 @@ def load_flights(loader: Neo4jLoader):
     - (:Flight) nodes for aircraft
     - (:Location) nodes based on rounded coordinates
     - [:PATROLLING] relationships
+    
+    Args:
+        loader: Neo4jLoader instance
+        log: Buffer for this loader's log lines
+        bulk: If True, load the aircraft with LOAD CSV instead of batches
     """
-    print("\n📥 Loading flight data...")
+    log.append("\n📥 Loading flight data...")
     
     if not FLIGHTS_FILE.exists():
-        print(f"   ⚠️  File not found: {FLIGHTS_FILE}")
+        log.append(f"   ⚠️  File not found: {FLIGHTS_FILE}")
         return 0
     
-    with open(FLIGHTS_FILE, 'r') as f:
-        data = json.load(f)
-    
-    aircraft = data.get("aircraft", [])
-    if not aircraft:
-        print("   ⚠️  No aircraft to load")
+    # Every aircraft changes position between snapshots, so the snapshot
+    # is either loaded whole or skipped when it has not changed
+    modified = FLIGHTS_FILE.stat().st_mtime_ns
+    if get_watermark(loader, "flights") == modified:
+        log.append("   ✓ Unchanged since the last load")
         return 0
     
-    # Create Flight nodes with Location relationship
-    query = """
-    UNWIND $batch AS flight
+    # Grid cells and links are collected while the aircraft stream past;
+    # they are a few short strings per aircraft
+    cells = {}
+    links = []
     
-    // Create Flight node
-    MERGE (f:Flight {icao24: flight.icao24})
-    SET f.callsign = flight.callsign,
-        f.origin_country = flight.origin_country,
-        f.latitude = flight.latitude,
-        f.longitude = flight.longitude,
-        f.geo_altitude = flight.geo_altitude,
-        f.velocity = flight.velocity,
-        f.tag = flight.tag,
-        f.on_ground = flight.on_ground
+    def aircraft(f):
+        for flight in ijson.items(f, 'aircraft.item', use_float=True):
+            cell = grid_cell(flight['latitude'], flight['longitude'])
+            cells[cell["grid"]] = cell
+            links.append({"icao24": flight['icao24'], "grid": cell["grid"]})
+            yield project(flight, FLIGHT_FIELDS)
     
-    WITH f, flight
+    # Create Flight nodes, streaming the aircraft array: only the queued
+    # batches are held in memory at a time
+    sizer = None
+    with open(FLIGHTS_FILE, 'rb') as f:
+        if bulk:
+            count = bulk_load(loader, "flight_radar.csv", FLIGHT_FIELDS, aircraft(f), FLIGHT_CSV_QUERY)
+        else:
+            sizer = get_batch_sizer(loader, "flights")
+            count = loader.run_batch(FLIGHT_QUERY, aircraft(f), sizer=sizer)
     
-    // Create Location based on rounded coordinates (grid cell)
-    MERGE (loc:Location {name: 'Grid_' + toString(round(flight.latitude, 0)) + '_' + toString(round(flight.longitude, 0))})
-    SET loc.lat = round(flight.latitude, 0),
-        loc.lon = round(flight.longitude, 0)
+    if not count:
+        log.append("   ⚠️  No aircraft to load")
+        return 0
     
-    // Create PATROLLING relationship
-    MERGE (f)-[:PATROLLING]->(loc)
-    """
+    # Link aircraft to their grid cells in parallel batches, ordered by
+    # cell like the event links
+    links.sort(key=itemgetter("grid"))
+    create_grid_cells(loader, cells.values())
+    patrolling = loader.run_iterate(
+        """
+        MATCH (f:Flight {icao24: row.icao24})
+        MATCH (loc:Location {name: row.grid})
+        MERGE (f)-[:PATROLLING]->(loc)
+        """,
+        links,
+        log
+    )
     
-    count = loader.run_batch(query, aircraft)
-    print(f"   ✓ Loaded {count} aircraft")
+    set_watermark(loader, "flights", modified, sizer and sizer.best)
+    log.append(f"   ✓ Loaded {count} aircraft ({patrolling} grid links)")
     return count
 
 
@@ -478,12 +1134,14 @@ def load_flights(loader: Neo4jLoader):
 # MAIN ENTRY POINT
 # ==============================================================================
 
-def main(wipe: bool = False):
+def main(wipe: bool = False, bulk: bool = False):
     """
     Main ETL entry point.
     
     Args:
         wipe: If True, delete all existing data before loading
+        bulk: If True (together with wipe), load events and flights
+            with LOAD CSV from staged files instead of batched queries
     """
     print("=" * 70)
     print("🔷 NEO4J ETL: Master Graph Database Loader")
@@ -503,13 +1161,37 @@ def main(wipe: bool = False):
         # Create schema constraints
         create_constraints(loader)
         
-        # Load all data sources
-        totals = {
-            "events": load_gdelt(loader),
-            "articles": load_news(loader),
-            "posts": load_telegram(loader),
-            "flights": load_flights(loader),
+        # After a wipe, secondary indexes are built once over the loaded
+        # data instead of being maintained by every write
+        if not wipe:
+            create_indexes(loader)
+        
+        # Load all data sources concurrently. The loaders write disjoint
+        # labels (apart from shared Location nodes, which the uniqueness
+        # constraint and retried write transactions keep consistent) and
+        # each batch opens its own session from the shared driver
+        def run_loader(fn) -> int:
+            log = []
+            try:
+                return fn(loader, log)
+            finally:
+                emit_log(log)
+        
+        loaders = {
+            "events": partial(load_gdelt, bulk=bulk),
+            "articles": load_news,
+            "posts": load_telegram,
+            "flights": partial(load_flights, bulk=bulk),
         }
+        try:
+            with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+                futures = {key: executor.submit(run_loader, fn) for key, fn in loaders.items()}
+                totals = {key: future.result() for key, future in futures.items()}
+        finally:
+            # Rebuilt even if a loader failed, so correlation never runs
+            # against a wiped graph without its point/range indexes
+            if wipe:
+                create_indexes(loader, wait=True)
         
         # Summary
         print("\n" + "=" * 70)
@@ -537,6 +1219,14 @@ if __name__ == "__main__":
         action="store_true", 
         help="Wipe database before loading (development only)"
     )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="With --wipe: load events and flights via LOAD CSV from neo4j/import"
+    )
     args = parser.parse_args()
     
-    main(wipe=args.wipe)
+    if args.bulk and not args.wipe:
+        parser.error("--bulk is only supported together with --wipe")
+    
+    main(wipe=args.wipe, bulk=args.bulk)